@@ -1,12 +1,136 @@
 import polars as pl
-from typing import Dict, Set, List, Any, Optional
+from typing import (
+    Dict, Set, List, Any, Optional, Tuple, Union, Iterable, Iterator,
+    Callable, TextIO, TypeVar)
+import json
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 from ..exceptions.report_exceptions import (
     DataValidationError,
-    FormulaCalculationError
+    FormulaCalculationError,
+    ReportConfigurationError
 )
+from ..utils.formula import compile_formula
+
+logger = logging.getLogger(__name__)
+
+
+# Restricted evaluation environment for row-wise formulas
+_SAFE_GLOBALS: Dict[str, Any] = {
+    "__builtins__": {},
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "pow": pow,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_formula_function(
+    formula: str,
+    param_names: Tuple[str, ...],
+    column_name: str
+) -> Callable[..., Any]:
+    """
+    Compile a formula into a function of its parameters, once per process.
+
+    The function takes the parameter values positionally, so evaluating a
+    row does not build a namespace dict.
+    """
+    filename = f"<formula:{column_name}>"
+    # Reject anything but a single expression before wrapping it
+    compile(formula, filename, "eval")
+    source = f"lambda {', '.join(param_names)}: ({formula})"
+    return eval(compile(source, filename, "eval"), _SAFE_GLOBALS)
+
+
+def _safe_eval_formula(
+    formula: str,
+    func: Callable[..., Any],
+    args: Tuple[Any, ...]
+) -> float:
+    """Safely evaluate a compiled formula with error handling."""
+    try:
+        result = func(*args)
+        return float(result) if result is not None else 0.0
+    except ZeroDivisionError:
+        return 0.0
+    except (TypeError, ValueError):
+        return 0.0
+    except Exception as e:
+        raise FormulaCalculationError(
+            f"Error calculating formula '{formula}': {str(e)}")
+
+
+# Aggregation functions by name, used to build cached column expressions
+_AGGREGATIONS = {
+    "sum": pl.sum,
+    "mean": pl.mean,
+    "n_unique": pl.n_unique,
+    "count": pl.count,
+    "first": pl.first,
+    "len": lambda col: pl.len(),
+}
+
+_FLOAT_DTYPES = (pl.Float32, pl.Float64)
+
+_FrameT = TypeVar("_FrameT", pl.DataFrame, pl.LazyFrame)
+
+OUTPUT_FORMATS = ("dict", "json")
+
+# Polars 1.23 moved streaming from a collect() flag to an engine
+_STREAMING_COLLECT_KWARGS: Dict[str, Any] = (
+    {"engine": "streaming"}
+    if tuple(int(part) for part in pl.__version__.split(".")[:2]) >= (1, 23)
+    else {"streaming": True}
+)
+
+
+class _RecordsJSON:
+    """Records kept as a DataFrame until Polars serializes them to JSON."""
+
+    __slots__ = ("df",)
+
+    def __init__(self, df: pl.DataFrame) -> None:
+        self.df = df
+
+    def to_json(self) -> str:
+        ndjson = self.df.write_ndjson()
+        return "[" + ndjson.rstrip("\n").replace("\n", ",") + "]"
+
+
+def _iter_report_json(report: Dict[str, Any]) -> Iterator[str]:
+    """
+    Encode a report as JSON chunks, splicing in record arrays.
+
+    Record arrays are serialized only when the encoder reaches them, so
+    at most one of them exists as a string at a time.
+    """
+    prefix = f"__records_{uuid.uuid4().hex}_"
+    fragments: Dict[str, _RecordsJSON] = {}
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, _RecordsJSON):
+            token = f"{prefix}{len(fragments)}"
+            fragments[json.dumps(token)] = obj
+            return token
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    for chunk in json.JSONEncoder(default=default).iterencode(report):
+        records = fragments.pop(chunk, None)
+        yield chunk if records is None else records.to_json()
+
+
+def _encode_report(report: Dict[str, Any]) -> str:
+    """Encode a report as a JSON string, splicing in record arrays."""
+    return "".join(_iter_report_json(report))
 
 
 class BaseReportBuilder(ABC):
@@ -26,18 +150,31 @@ class BaseReportBuilder(ABC):
         self.avg_columns: List[str] = []
         self.counting_columns: List[str] = []
         self.simple_counting_columns: List[str] = []
+        self.pre_deduplicated_columns: Set[str] = set()
+        self._null_free_columns: Set[str] = set()
         self.first_select_columns: List[str] = []
         self.constants_map: Dict[str, Any] = {}
         self.group_by_columns: List[str] = [
             "day", "month", "year", "week_of_month"]
         self.formula_mappings: List[Dict[str, Any]] = []
+        self._formula_exprs: Optional[
+            List[Tuple[Dict[str, Any], pl.Expr]]] = None
         self.shift_mapping: Dict[str, str] = {}
         self.roundoff_columns: Dict[str, int] = {}
-        self.summary_columns: Set[str] = set()
+        self.summary_columns: Tuple[str, ...] = ()
         self.time_format_mapping: Dict[str, Dict[str, str]] = {}
         self.df: Optional[pl.DataFrame] = None
+        self.lazy_df: Optional[pl.LazyFrame] = None
+        self.start_date: Optional[date] = None
+        self.end_date: Optional[date] = None
         self.doff_number_column: Optional[str] = None
+        self._expr_cache: Dict[
+            Tuple[str, Tuple[str, ...]], List[Tuple[str, pl.Expr]]] = {}
         self.department_id: Optional[str] = None
+        self.output_format: str = "dict"
+        self.max_workers: Optional[int] = None
+        self.streaming: bool = False
+        self.output_writer: Optional[TextIO] = None
 
     # Configuration setters with method chaining
     def set_sorting_columns(self, columns: List[str]) -> 'BaseReportBuilder':
@@ -53,13 +190,41 @@ class BaseReportBuilder(ABC):
         self.column_mappings = mappings
         return self
 
-    def set_dataframe(self, df: pl.DataFrame) -> 'BaseReportBuilder':
-        """Set the input DataFrame for processing."""
+    def set_dataframe(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> 'BaseReportBuilder':
+        """
+        Set the input data for processing.
+
+        A LazyFrame is kept lazy until build(), so only the columns the
+        report actually uses are read from the source.
+        """
+        if isinstance(df, pl.LazyFrame):
+            self.lazy_df = df
+            self.df = None
+            return self
         if not isinstance(df, pl.DataFrame):
-            raise DataValidationError("Input must be a Polars DataFrame")
+            raise DataValidationError(
+                "Input must be a Polars DataFrame or LazyFrame")
         if df.is_empty():
             raise DataValidationError("DataFrame cannot be empty")
         self.df = df
+        self.lazy_df = None
+        return self
+
+    def set_date_range(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> 'BaseReportBuilder':
+        """Set an inclusive date range to filter the input rows by."""
+        if start_date is not None and end_date is not None \
+                and start_date > end_date:
+            raise ReportConfigurationError(
+                f"start_date {start_date} is after end_date {end_date}")
+        self.start_date = start_date
+        self.end_date = end_date
         return self
 
     def set_shift_mapping(
@@ -76,6 +241,7 @@ class BaseReportBuilder(ABC):
     ) -> 'BaseReportBuilder':
         """Set formula mappings for calculated columns."""
         self.formula_mappings = mappings
+        self._formula_exprs = None
         return self
 
     def set_roundoff_columns(
@@ -88,10 +254,14 @@ class BaseReportBuilder(ABC):
 
     def set_summary_columns(
         self,
-        columns: Set[str]
+        columns: Iterable[str]
     ) -> 'BaseReportBuilder':
         """Set columns to be summarized."""
-        self.summary_columns = columns
+        # Freeze into a tuple with a stable order; sets are sorted so the
+        # summary column order does not depend on string hashing
+        if isinstance(columns, (set, frozenset)):
+            columns = sorted(columns)
+        self.summary_columns = tuple(columns)
         return self
 
     def set_agg_columns(
@@ -124,6 +294,7 @@ class BaseReportBuilder(ABC):
     ) -> 'BaseReportBuilder':
         """Set constants map for formula calculations."""
         self.constants_map = constants_map
+        self._formula_exprs = None
         return self
 
     def set_counting_columns(self, columns: List[str]) -> 'BaseReportBuilder':
@@ -139,12 +310,28 @@ class BaseReportBuilder(ABC):
         self.simple_counting_columns = columns
         return self
 
+    def set_pre_deduplicated_columns(
+        self,
+        columns: Set[str]
+    ) -> 'BaseReportBuilder':
+        """
+        Set counting columns known to hold no duplicate values.
+
+        Distinct counts of these columns equal the row count, so they are
+        counted with pl.len() instead of hashing values with n_unique.
+        """
+        self.pre_deduplicated_columns = set(columns)
+        return self
+
     def set_group_by_columns(
         self,
         columns: List[str]
     ) -> 'BaseReportBuilder':
         """Add additional columns to group by."""
-        self.group_by_columns = self.group_by_columns + columns
+        # Keep the first occurrence of each key; duplicate group keys only
+        # make the group-by hash larger
+        self.group_by_columns = list(
+            dict.fromkeys(self.group_by_columns + list(columns)))
         return self
 
     def set_department_id(self, department_id: str) -> 'BaseReportBuilder':
@@ -152,194 +339,670 @@ class BaseReportBuilder(ABC):
         self.department_id = department_id
         return self
 
+    def set_output_format(self, output_format: str) -> 'BaseReportBuilder':
+        """
+        Set the output format of build().
+
+        "dict" (default) returns the report as a dictionary. "json" returns
+        a JSON string, with record lists serialized directly by Polars
+        instead of being materialized as Python dicts first.
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ReportConfigurationError(
+                f"Unsupported output format: {output_format}. "
+                f"Expected one of {OUTPUT_FORMATS}")
+        self.output_format = output_format
+        return self
+
+    def set_streaming(self, streaming: bool) -> 'BaseReportBuilder':
+        """
+        Run Polars queries on the streaming engine.
+
+        Streaming processes the input in batches, keeping memory bounded
+        for inputs much larger than RAM. It is off by default because
+        operations the engine does not support fall back to in-memory
+        execution anyway.
+        """
+        self.streaming = streaming
+        return self
+
+    def set_output_writer(
+        self,
+        writer: Optional[TextIO]
+    ) -> 'BaseReportBuilder':
+        """
+        Stream the report as JSON into a writable text stream.
+
+        When set, build() writes the report to writer chunk by chunk and
+        returns None, so the serialized report never exists in memory as
+        a whole.
+        """
+        if writer is not None and not hasattr(writer, "write"):
+            raise ReportConfigurationError(
+                "Output writer must have a write() method")
+        self.output_writer = writer
+        return self
+
+    def set_max_workers(
+        self,
+        max_workers: Optional[int]
+    ) -> 'BaseReportBuilder':
+        """
+        Set the number of threads used to build independent sections.
+
+        None (default) uses the executor's default; 1 builds sections
+        sequentially. Polars releases the GIL inside its kernels, so
+        sections with many small group operations overlap well.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ReportConfigurationError(
+                f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        return self
+
+    def configure(self, **settings: Any) -> 'BaseReportBuilder':
+        """
+        Apply several settings at once through their set_<name> methods.
+
+        Each setter keeps its own validation; unknown names raise
+        ReportConfigurationError.
+        """
+        for name, value in settings.items():
+            setter = getattr(self, f"set_{name}", None)
+            if setter is None:
+                raise ReportConfigurationError(
+                    f"Unknown builder setting: {name}")
+            setter(value)
+        return self
+
     # Core data processing methods
+    def _get_required_columns(self) -> Set[str]:
+        """Get all input columns referenced by the report configuration."""
+        columns = {"date", "shift_id", "platform_shift_id", "asset_id"}
+        columns.update(self.group_by_columns)
+        columns.update(self.sorting_columns)
+        columns.update(self.agg_columns)
+        columns.update(self.avg_columns)
+        columns.update(self.counting_columns)
+        columns.update(self.simple_counting_columns)
+        columns.update(self.first_select_columns)
+        if self.column_mappings:
+            columns.update(self.column_mappings)
+        for mapping in self.formula_mappings:
+            columns.update(mapping["paramColumnMap"].values())
+        if self.doff_number_column:
+            columns.add(self.doff_number_column)
+        return columns
+
+    @staticmethod
+    def _get_schema(
+        df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> Dict[str, pl.DataType]:
+        """Get the schema of a DataFrame or LazyFrame."""
+        if hasattr(df, "collect_schema"):
+            return df.collect_schema()
+        return df.schema
+
+    def _date_range_filter(
+        self,
+        schema: Dict[str, pl.DataType]
+    ) -> Optional[pl.Expr]:
+        """Build the date range predicate, if a range is set."""
+        if "date" not in schema or (
+                self.start_date is None and self.end_date is None):
+            return None
+
+        # ISO date strings order like dates, so string columns are
+        # compared directly and the predicate can still be pushed down;
+        # Datetime columns are compared by calendar day, so rows later on
+        # the end date are kept
+        date_col = pl.col("date")
+        if schema["date"] == pl.Utf8:
+            start = self.start_date and self.start_date.isoformat()
+            end = self.end_date and self.end_date.isoformat()
+        else:
+            start, end = self.start_date, self.end_date
+            if isinstance(schema["date"], pl.Datetime):
+                date_col = date_col.cast(pl.Date)
+
+        conditions = []
+        if start is not None:
+            conditions.append(date_col >= pl.lit(start))
+        if end is not None:
+            conditions.append(date_col <= pl.lit(end))
+        return pl.all_horizontal(conditions)
+
+    def _collect_lazy_df(self) -> pl.DataFrame:
+        """Collect the lazy input, projecting only the required columns."""
+        schema = self._get_schema(self.lazy_df)
+        lazy_df = self.lazy_df
+
+        date_filter = self._date_range_filter(schema)
+        if date_filter is not None:
+            lazy_df = lazy_df.filter(date_filter)
+
+        required_columns = self._get_required_columns()
+        return lazy_df.select([
+            col for col in schema if col in required_columns
+        ]).collect(**self._collect_kwargs())
+
     def _add_additional_columns(self) -> None:
         """Add date-based columns to the DataFrame."""
         if "date" not in self.df.columns:
             return
 
         try:
-            date_expr = pl.col("date").str.strptime(pl.Date, "%Y-%m-%d")
-            self.df = self.df.with_columns([
-                date_expr.dt.day().alias("day"),
-                date_expr.dt.month().alias("month"),
-                date_expr.dt.year().alias("year"),
-                ((date_expr.dt.day() - 1) // 7 + 1).alias("week_of_month")
-            ])
+            # Parse the date once into a temporary column; Date and Datetime
+            # columns are used as they are
+            dtype = self.df.schema["date"]
+            if dtype == pl.Date or isinstance(dtype, pl.Datetime):
+                parsed_date = pl.col("date")
+            else:
+                parsed_date = pl.col("date").str.strptime(pl.Date, "%Y-%m-%d")
+
+            date_expr = pl.col("__date")
+            self.df = (
+                self.df.lazy()
+                .with_columns(parsed_date.alias("__date"))
+                .with_columns([
+                    date_expr.dt.day().alias("day"),
+                    date_expr.dt.month().alias("month"),
+                    date_expr.dt.year().alias("year"),
+                    ((date_expr.dt.day() - 1) // 7 + 1).alias("week_of_month")
+                ])
+                .drop("__date")
+                .collect()
+            )
         except Exception as e:
             raise DataValidationError(
                 f"Error processing date column: {str(e)}")
 
-    def group_data(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Group and aggregate the DataFrame."""
+    def _get_column_exprs(
+        self,
+        aggregation: str,
+        columns: List[str]
+    ) -> List[Tuple[str, pl.Expr]]:
+        """Get (column, expression) pairs, building them once per columns."""
+        key = (aggregation, tuple(columns))
+        if key not in self._expr_cache:
+            agg_func = _AGGREGATIONS[aggregation]
+            self._expr_cache[key] = [
+                (col, agg_func(col).alias(col)) for col in columns
+            ]
+        return self._expr_cache[key]
+
+    def _aggregation_exprs(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        include_first_values: bool = False
+    ) -> List[pl.Expr]:
+        """Get aggregation expressions for configured columns in df."""
+        schema = self._get_schema(df)
+        column_groups = [
+            ("sum", self.agg_columns),
+            ("mean", self.avg_columns),
+            ("n_unique", [
+                col for col in self.counting_columns
+                if col not in self.pre_deduplicated_columns
+            ]),
+            ("len", [
+                col for col in self.counting_columns
+                if col in self.pre_deduplicated_columns
+            ]),
+            # Without nulls a non-null count is just the group length
+            ("count", [
+                col for col in self.simple_counting_columns
+                if col not in self._null_free_columns
+            ]),
+            ("len", [
+                col for col in self.simple_counting_columns
+                if col in self._null_free_columns
+            ]),
+        ]
+        if include_first_values:
+            column_groups.append(("first", self.first_select_columns))
+
+        return [
+            expr
+            for aggregation, columns in column_groups
+            for col, expr in self._get_column_exprs(aggregation, columns)
+            if col in schema
+        ]
+
+    def group_data(
+        self,
+        df: _FrameT,
+        extra_keys: Optional[List[str]] = None,
+        group_by_columns: Optional[List[str]] = None
+    ) -> _FrameT:
+        """
+        Group and aggregate the DataFrame.
+
+        extra_keys are grouped on in addition to the group by columns, so
+        that several sections can be aggregated (and later sorted) in one
+        pass and split with partition_by afterwards. group_by_columns
+        overrides the configured group by columns.
+        """
+        if group_by_columns is None:
+            group_by_columns = self.group_by_columns
+
         try:
-            aggs = (
-                [
-                    pl.sum(col).alias(col)
-                    for col in self.agg_columns if col in df.columns
-                ] +
-                [
-                    pl.mean(col).alias(col)
-                    for col in self.avg_columns if col in df.columns
-                ] +
-                [
-                    pl.n_unique(col).alias(col)
-                    for col in self.counting_columns if col in df.columns
-                ] +
-                [
-                    pl.count(col).alias(col)
-                    for col in self.simple_counting_columns
-                    if col in df.columns
-                ] +
-                [
-                    pl.first(col).alias(col)
-                    for col in self.first_select_columns if col in df.columns
-                ]
-            )
+            aggs = self._aggregation_exprs(df, include_first_values=True)
 
             # Filter group by columns to only include existing columns
+            schema = self._get_schema(df)
             existing_group_columns = [
-                col for col in self.group_by_columns if col in df.columns]
+                col for col in group_by_columns if col in schema]
 
             if not existing_group_columns:
                 raise DataValidationError(
                     "No valid grouping columns found in DataFrame")
 
+            if extra_keys:
+                existing_group_columns += [
+                    col for col in extra_keys
+                    if col not in existing_group_columns
+                ]
+                # A key is constant within its group, so it replaces any
+                # aggregation of the same column
+                aggs = [
+                    expr for expr in aggs
+                    if expr.meta.output_name() not in existing_group_columns
+                ]
+
             return df.group_by(existing_group_columns).agg(aggs)
         except Exception as e:
             raise DataValidationError(f"Error grouping data: {str(e)}")
 
-    def _calculate_summary(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Calculate summary statistics for the given DataFrame."""
-        try:
-            summary_expressions = []
-
-            # Add aggregation expressions for existing columns
-            for col in self.agg_columns:
-                if col in df.columns:
-                    summary_expressions.append(pl.sum(col).alias(col))
-
-            for col in self.avg_columns:
-                if col in df.columns:
-                    summary_expressions.append(pl.mean(col).alias(col))
-
-            for col in self.counting_columns:
-                if col in df.columns:
-                    summary_expressions.append(pl.n_unique(col).alias(col))
+    def _calculate_summary(
+        self,
+        df: _FrameT,
+        group_by: Optional[List[str]] = None
+    ) -> _FrameT:
+        """
+        Calculate summary statistics for the given DataFrame.
 
-            for col in self.simple_counting_columns:
-                if col in df.columns:
-                    summary_expressions.append(pl.count(col).alias(col))
+        When group_by is given, one summary row is produced per group in a
+        single pass, with the group key columns kept alongside. A
+        LazyFrame input returns the summary query without running it.
+        """
+        try:
+            summary_expressions = self._aggregation_exprs(df)
 
             if not summary_expressions:
                 raise DataValidationError("No valid summary columns found")
 
-            result_df = df.select(summary_expressions)
+            if group_by:
+                result_df = df.group_by(group_by).agg(summary_expressions)
+            else:
+                group_by = []
+                result_df = df.select(summary_expressions)
 
             # Filter to only include summary columns that exist
+            result_schema = self._get_schema(result_df)
             existing_summary_cols = [
                 col for col in self.summary_columns
-                if col in result_df.columns
+                if col in result_schema and col not in group_by
             ]
             if existing_summary_cols:
-                return result_df.select(existing_summary_cols)
+                return result_df.select(group_by + existing_summary_cols)
 
             return result_df
         except Exception as e:
             raise DataValidationError(f"Error calculating summary: {str(e)}")
 
-    def _add_calculated_columns(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Add calculated columns based on formula mappings."""
-        def safe_eval_formula(formula: str, kwargs: Dict[str, Any]) -> float:
-            """Safely evaluate formula with error handling."""
+    def _summary_is_additive(self) -> bool:
+        """
+        Whether summaries can be built by summing finer-grained summaries.
+
+        Sums and counts add up across disjoint groups; means and distinct
+        counts do not.
+        """
+        return not self.avg_columns and all(
+            col in self.pre_deduplicated_columns
+            for col in self.counting_columns
+        )
+
+    @staticmethod
+    def _rollup_summary(
+        group_summaries: _FrameT,
+        group_by: List[str]
+    ) -> _FrameT:
+        """Combine additive per-group summaries into one summary row."""
+        return group_summaries.select(pl.all().exclude(group_by).sum())
+
+    def _build_section_frames(
+        self,
+        section_keys: List[str],
+        group_by_columns: Optional[List[str]] = None
+    ) -> Tuple[
+        Dict[str, Any],
+        Dict[Tuple[Any, ...], Dict[str, Any]],
+        pl.DataFrame
+    ]:
+        """
+        Calculate the overall summary, section summaries and records.
+
+        The three are planned as lazy queries over self.df and collected
+        together. Records are grouped within each section and sorted; use
+        _partition_records to split them by section.
+
+        Returns:
+            Tuple of the overall summary, the section summaries keyed by
+            section key and the records of all sections
+        """
+        lf = self.df.lazy()
+
+        section_summaries_lf = self._calculate_summary(lf, section_keys)
+        if self._summary_is_additive():
+            # Sections partition the data, so the overall summary is their sum
+            overall_lf = self._rollup_summary(
+                section_summaries_lf, section_keys)
+        else:
+            overall_lf = self._calculate_summary(lf)
+        records_lf = self.group_data(
+            lf, extra_keys=section_keys, group_by_columns=group_by_columns)
+
+        overall_df, section_summaries_df, records_df = self._collect_all([
+            overall_lf
+            .pipe(self._add_calculated_columns)
+            .pipe(self.roundoff),
+            section_summaries_lf
+            .pipe(self._add_calculated_columns)
+            .pipe(self.roundoff),
+            records_lf
+            .pipe(self._add_calculated_columns)
+            .pipe(self.roundoff)
+            .pipe(self.sort_df),
+        ])
+
+        return (
+            overall_df.row(0, named=True),
+            self._rows_by_key(section_summaries_df, section_keys),
+            records_df
+        )
+
+    def _partition_records(
+        self,
+        records_df: pl.DataFrame,
+        section_keys: List[str],
+        group_by_columns: Optional[List[str]] = None
+    ) -> Dict[Tuple[Any, ...], pl.DataFrame]:
+        """
+        Split sorted records by section, keeping their order.
+
+        Section keys that were only grouped on for partitioning are
+        dropped, so records keep the columns of a per-section group_data.
+        """
+        if group_by_columns is None:
+            group_by_columns = self.group_by_columns
+        added_keys = [
+            col for col in section_keys
+            if col not in group_by_columns
+            and col not in self.first_select_columns
+        ]
+
+        partitions = records_df.partition_by(
+            section_keys, as_dict=True, maintain_order=True)
+        return {
+            key: partition.drop(added_keys)
+            for key, partition in partitions.items()
+        }
+
+    def _format_date_labels(
+        self,
+        df: pl.DataFrame,
+        formats: Dict[str, str],
+        date_keys: Optional[List[str]] = None
+    ) -> Dict[Tuple[Any, ...], Dict[str, str]]:
+        """
+        Format each distinct date once, keyed by its date key columns.
+
+        date_keys default to (year, month, day); without a day column the
+        first day of the month is formatted.
+        """
+        date_keys = date_keys or ["year", "month", "day"]
+        day_expr = pl.col("day") if "day" in date_keys else 1
+        date_expr = pl.date(pl.col("year"), pl.col("month"), day_expr)
+        labels_df = df.select(date_keys).unique().with_columns([
+            date_expr.dt.strftime(fmt).alias(name)
+            for name, fmt in formats.items()
+        ])
+        return self._rows_by_key(labels_df, date_keys)
+
+    def _map_groups(
+        self,
+        func: Callable[..., Any],
+        groups: List[Tuple[Any, ...]]
+    ) -> List[Any]:
+        """Apply func to each argument tuple, in parallel when enabled."""
+        if self.max_workers == 1 or len(groups) < 2:
+            return [func(*args) for args in groups]
+
+        # Build lazily cached formula expressions before fanning out
+        self._get_formula_exprs()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda args: func(*args), groups))
+
+    @staticmethod
+    def _rows_by_key(
+        df: pl.DataFrame,
+        keys: List[str]
+    ) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+        """Convert rows to dicts keyed by their key column values."""
+        rows = {}
+        for row in df.to_dicts():
+            rows[tuple(row.pop(col) for col in keys)] = row
+        return rows
+
+    def _formula_expr(self, mapping: Dict[str, Any]) -> pl.Expr:
+        """Build the Polars expression for a single formula mapping."""
+        formula = mapping["formula"]
+        param_column_map = mapping["paramColumnMap"]
+        param_const_map = mapping.get("paramConstMap", {})
+
+        # Map constants
+        param_const_val_map = {}
+        for param, const in param_const_map.items():
+            if const in self.constants_map:
+                param_const_val_map[param] = self.constants_map[const]
+
+        expr = compile_formula(formula, param_column_map, param_const_val_map)
+        if expr is None:
+            # Fall back to row-wise evaluation for non-arithmetic formulas
+            logger.debug(
+                "Formula for %s is not vectorizable, evaluating row by row",
+                mapping["column_name"]
+            )
+            # Constants shadow columns, matching the eval() namespace merge
+            const_names = tuple(param_const_val_map)
+            const_values = tuple(param_const_val_map.values())
+            column_params = [
+                (param, column) for param, column in param_column_map.items()
+                if param not in param_const_val_map
+            ]
             try:
-                # Create a safe evaluation environment
-                safe_globals = {
-                    "__builtins__": {},
-                    "abs": abs,
-                    "min": min,
-                    "max": max,
-                    "round": round,
-                    "pow": pow,
-                }
-                result = eval(formula, safe_globals, kwargs)
-                return float(result) if result is not None else 0.0
-            except ZeroDivisionError:
-                return 0.0
-            except (TypeError, ValueError):
-                return 0.0
-            except Exception as e:
+                func = _compile_formula_function(
+                    formula,
+                    const_names + tuple(param for param, _ in column_params),
+                    mapping["column_name"]
+                )
+            except SyntaxError as e:
                 raise FormulaCalculationError(
                     f"Error calculating formula '{formula}': {str(e)}")
 
+            if not column_params:
+                # Constants shadow every parameter, so the result does not
+                # depend on the row; evaluate once and broadcast it
+                value = _safe_eval_formula(formula, func, const_values)
+                expr = pl.lit(value, dtype=pl.Float64)
+            else:
+                def evaluate_batch(batch: pl.Series) -> pl.Series:
+                    # Convert each parameter column once, then call the
+                    # formula on zipped values instead of per-row dicts
+                    values = [
+                        batch.struct.field(column).to_list()
+                        for _, column in column_params
+                    ]
+                    return pl.Series([
+                        _safe_eval_formula(formula, func, const_values + args)
+                        for args in zip(*values)
+                    ], dtype=pl.Float64)
+
+                columns = list(dict.fromkeys(
+                    column for _, column in column_params))
+                expr = pl.struct(columns).map_batches(
+                    evaluate_batch, return_dtype=pl.Float64)
+
+        return expr.alias(mapping["column_name"])
+
+    def _get_formula_exprs(self) -> List[Tuple[Dict[str, Any], pl.Expr]]:
+        """Get formula expressions, compiling them on first use."""
+        if self._formula_exprs is None:
+            self._formula_exprs = [
+                (mapping, self._formula_expr(mapping))
+                for mapping in self.formula_mappings
+            ]
+        return self._formula_exprs
+
+    def _add_calculated_columns(self, df: _FrameT) -> _FrameT:
+        """Add calculated columns based on formula mappings."""
         try:
-            for mapping in self.formula_mappings:
+            columns = self._get_schema(df)
+            # Independent formulas are applied together in one pass;
+            # a formula reading an earlier formula's output starts a new one
+            pending: List[pl.Expr] = []
+            pending_columns: Set[str] = set()
+
+            for mapping, expr in self._get_formula_exprs():
                 column_name = mapping["column_name"]
-                param_column_map = mapping["paramColumnMap"]
-                param_const_map = mapping.get("paramConstMap", {})
+                param_columns = list(mapping["paramColumnMap"].values())
 
-                # Map constants
-                param_const_val_map = {}
-                for param, const in param_const_map.items():
-                    if const in self.constants_map:
-                        param_const_val_map[param] = self.constants_map[const]
+                if pending and (column_name in pending_columns or
+                                pending_columns.intersection(param_columns)):
+                    df = df.with_columns(pending)
+                    columns = self._get_schema(df)
+                    pending, pending_columns = [], set()
 
                 # Check if all required columns exist
                 missing_columns = [
-                    col for col in param_column_map.values()
-                    if col not in df.columns
+                    col for col in param_columns if col not in columns
                 ]
                 if missing_columns:
-                    logging.warning(
-                        f"Skipping formula for {column_name}: "
-                        "missing columns {missing_columns}"
+                    logger.warning(
+                        "Skipping formula for %s: missing columns %s",
+                        column_name, missing_columns
                     )
                     continue
 
-                df = df.with_columns([
-                    pl.struct(list(param_column_map.values()))
-                    .map_elements(lambda row: safe_eval_formula(
-                        mapping["formula"],
-                        {k: row[v] for k, v in param_column_map.items()
-                         } | param_const_val_map
-                    ), return_dtype=pl.Float64)
-                    .alias(column_name)
-                ])
+                pending.append(expr)
+                pending_columns.add(column_name)
+
+            if pending:
+                df = df.with_columns(pending)
         except Exception as e:
             raise FormulaCalculationError(
                 f"Error adding calculated columns: {str(e)}")
 
         return df
 
-    def roundoff(self, df: pl.DataFrame) -> pl.DataFrame:
+    def roundoff(self, df: _FrameT) -> _FrameT:
         """Round specified columns to their configured decimal places."""
         if not self.roundoff_columns:
             return df
 
         try:
-            round_expr = []
-            for col in df.columns:
-                if (col in self.roundoff_columns and
-                    col in df.columns and
-                        str(df.schema[col]).startswith(
-                            ('Float32', 'Float64'))):
-                    round_expr.append(
-                        pl.col(col).round(
-                            self.roundoff_columns[col]).alias(col)
-                    )
-                else:
-                    round_expr.append(pl.col(col))
+            # Only float columns are rounded; others pass through untouched.
+            # Columns sharing a precision are rounded by one expression
+            schema = self._get_schema(df)
+            columns_by_decimals: Dict[int, List[str]] = {}
+            for col, decimals in self.roundoff_columns.items():
+                if schema.get(col) in _FLOAT_DTYPES:
+                    columns_by_decimals.setdefault(decimals, []).append(col)
+            if not columns_by_decimals:
+                return df
+
+            round_expr = [
+                pl.col(columns).round(decimals)
+                for decimals, columns in columns_by_decimals.items()
+            ]
 
-            return df.select(round_expr)
+            return df.with_columns(round_expr)
         except Exception as e:
             raise DataValidationError(f"Error rounding columns: {str(e)}")
 
-    def sort_df(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _calculate_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Add calculated columns and round them in one fused query.
+
+        Both steps run on a LazyFrame, so formula outputs are rounded
+        without materializing the intermediate DataFrame.
+        """
+        try:
+            return (
+                df.lazy()
+                .pipe(self._add_calculated_columns)
+                .pipe(self.roundoff)
+                .collect(**self._collect_kwargs())
+            )
+        except (FormulaCalculationError, DataValidationError):
+            raise
+        except Exception as e:
+            raise FormulaCalculationError(
+                f"Error adding calculated columns: {str(e)}")
+
+    def _collect_kwargs(self) -> Dict[str, Any]:
+        """Get the collect() arguments for the configured engine."""
+        return _STREAMING_COLLECT_KWARGS if self.streaming else {}
+
+    def _collect_all(
+        self,
+        frames: List[pl.LazyFrame]
+    ) -> List[pl.DataFrame]:
+        """
+        Run several queries over the same input together.
+
+        Polars executes the queries in parallel and can share their
+        common subplans, instead of scanning the input once per query.
+        """
+        try:
+            return pl.collect_all(frames, **self._collect_kwargs())
+        except (FormulaCalculationError, DataValidationError):
+            raise
+        except Exception as e:
+            raise DataValidationError(
+                f"Error processing report data: {str(e)}")
+
+    def _select_record_columns(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Project records to the mapped columns, always keeping asset_id."""
+        columns = [col for col in df.columns if col in self.column_mappings]
+        if "asset_id" in columns:
+            return df.select(columns)
+        if "asset_id" in df.schema:
+            return df.select(columns + ["asset_id"])
+        return df.select(columns).with_columns(
+            pl.lit(None).alias("asset_id"))
+
+    def _to_records(
+        self,
+        df: pl.DataFrame
+    ) -> Union[List[Dict[str, Any]], _RecordsJSON]:
+        """Convert record rows to the representation for the output format."""
+        records_df = self._select_record_columns(df)
+        if self.output_format == "json" or self.output_writer is not None:
+            return _RecordsJSON(records_df)
+        return records_df.to_dicts()
+
+    def sort_df(self, df: _FrameT) -> _FrameT:
         """Sort DataFrame by configured sorting columns."""
+        if not self.sorting_columns:
+            return df
+
         try:
             # Filter out columns that do not exist in the DataFrame
+            schema = self._get_schema(df)
             existing_columns = [
-                col for col in self.sorting_columns if col in df.columns]
+                col for col in self.sorting_columns if col in schema]
 
             if existing_columns:
                 return df.sort(existing_columns)
@@ -347,7 +1010,7 @@ class BaseReportBuilder(ABC):
             # If no sorting columns specified or exist, return as-is
             return df
         except Exception as e:
-            logging.warning(f"Error sorting DataFrame: {str(e)}")
+            logger.warning("Error sorting DataFrame: %s", e)
             return df
 
     @abstractmethod
@@ -358,31 +1021,57 @@ class BaseReportBuilder(ABC):
 
     def validate_required_columns(self, required_columns: List[str]) -> None:
         """Validate that required columns exist in the DataFrame."""
-        if not self.df:
+        if self.df is None:
             raise DataValidationError("DataFrame not set")
 
+        schema = self.df.schema
         missing_columns = [
-            col for col in required_columns if col not in self.df.columns]
+            col for col in required_columns if col not in schema]
         if missing_columns:
             raise DataValidationError(
                 f"Required columns missing: {missing_columns}")
 
-    def build(self) -> Optional[Dict[str, Any]]:
-        """Build the final report."""
+    def build(self) -> Optional[Union[Dict[str, Any], str]]:
+        """Build the final report in the configured output format."""
+        if self.lazy_df is not None:
+            logger.debug("Collecting lazy input")
+            self.df = self._collect_lazy_df()
+            self.lazy_df = None
+        elif isinstance(self.df, pl.DataFrame):
+            date_filter = self._date_range_filter(self.df.schema)
+            if date_filter is not None:
+                self.df = self.df.filter(date_filter)
+
         if not isinstance(self.df, pl.DataFrame) or self.df.is_empty():
-            logging.warning("No valid data loaded or DataFrame is empty.")
+            logger.warning("No valid data loaded or DataFrame is empty.")
             return None
 
         try:
-            logging.debug("Adding additional columns")
+            logger.debug("Adding additional columns")
             self._add_additional_columns()
 
-            logging.debug("Sorting data")
+            logger.debug("Sorting data")
             self.df = self.sort_df(self.df)
 
-            logging.debug("Preparing response")
-            return self.prepare_response()
+            # Null counts are stored with the data, so this does not scan;
+            # any group of a null-free column is null-free as well
+            schema = self.df.schema
+            self._null_free_columns = {
+                col for col in self.simple_counting_columns
+                if col in schema and self.df[col].null_count() == 0
+            }
+
+            logger.debug("Preparing response")
+            response = self.prepare_response()
+
+            if self.output_writer is not None:
+                for chunk in _iter_report_json(response):
+                    self.output_writer.write(chunk)
+                return None
+            if self.output_format == "json":
+                return _encode_report(response)
+            return response
 
         except Exception as e:
-            logging.error(f"Error building report: {str(e)}")
+            logger.error("Error building report: %s", e)
             raise
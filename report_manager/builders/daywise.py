@@ -1,60 +1,38 @@
+import polars as pl
 from typing import Dict, Any
-from datetime import datetime
 
 from ..builders.base import BaseReportBuilder
 
 
 class DaywiseReportBuilder(BaseReportBuilder):
     def prepare_response(self) -> Dict[str, Any]:
-        # Process overall summary in one chain
-        overall_summary = (
-            self._calculate_summary(self.df)
-            .pipe(self._add_calculated_columns)
-            .pipe(self.roundoff)
-            .to_dicts()[0]
-        )
-
-        sections = []
-        # Process each day's data
-        for (year, month, day), day_group in self.df.group_by(
-                ["year", "month", "day"]):
-            date_str = f"{year:04d}-{month:02d}-{day:02d}"
-
-            # Process day summary and records in chains
-            day_summary = (
-                self._calculate_summary(day_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .to_dicts()[0]
-            )
-
-            records = (
-                self.group_data(day_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .pipe(self.sort_df)
-                .to_dicts()
+        day_keys = ["year", "month", "day"]
+
+        # Summaries and records of all days are calculated together
+        overall_summary, day_summaries, records_df = (
+            self._build_section_frames(day_keys))
+
+        # Add sequential doff_number within each day
+        if self.doff_number_column:
+            records_df = records_df.with_columns(
+                pl.int_range(1, pl.len() + 1)
+                .over(day_keys)
+                .alias(self.doff_number_column)
             )
 
-            # Add sequential doff_number
-            if self.doff_number_column:
-                for i, record in enumerate(records, 1):
-                    record[self.doff_number_column] = i
+        # Format the date labels of all days at once
+        day_labels = self._format_date_labels(
+            records_df, {"date": "%Y-%m-%d", "title": "%d %b %Y"})
 
-            filtered_records = [
-                {
-                    **{
-                        key: record[key]
-                        for key in record
-                        if key in self.column_mappings
-                    },
-                    'asset_id': record.get('asset_id', None)
-                }
-                for record in records
-            ]
+        day_partitions = self._partition_records(records_df, day_keys)
 
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%d %b %Y")
+        sections = []
+        # Process each day's data in (year, month, day) order
+        for day_key in sorted(day_partitions):
+            labels = day_labels[day_key]
+            date_str, formatted_date = labels["date"], labels["title"]
+            day_summary = day_summaries[day_key]
+            filtered_records = self._to_records(day_partitions[day_key])
 
             sections.append(
                 {
@@ -68,7 +46,7 @@ class DaywiseReportBuilder(BaseReportBuilder):
 
         return {
             "report_type": "daywise",
-            "sections": sorted(sections, key=lambda x: x["date"]),
+            "sections": sections,
             "summary_label": "overall summary",
             "summary": overall_summary,
             "column_header_mapping": self.column_mappings,
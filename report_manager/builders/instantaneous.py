@@ -5,36 +5,22 @@ from ..builders.base import BaseReportBuilder
 
 class InstantaneousReportBuilder(BaseReportBuilder):
     def prepare_response(self) -> Dict[str, Any]:
-        # Calculate overall summary once
-        overall_summary = (
-            self._calculate_summary(self.df)
+        lf = self.df.lazy()
+        # Group the records of every shift in one pass, keeping shifts apart
+        records_lf = self.group_data(lf, extra_keys=["platform_shift_id"])
+
+        # The overall summary and the records are collected together
+        overall_df, records_df = self._collect_all([
+            self._calculate_summary(lf)
+            .pipe(self._add_calculated_columns)
+            .pipe(self.roundoff),
+            records_lf
             .pipe(self._add_calculated_columns)
             .pipe(self.roundoff)
-            .to_dicts()[0]
-        )
-
-        # Process each shift's data
-        for shift_id, group_df in self.df.group_by(
-                "platform_shift_id"):
-            # Process group records
-            records = (
-                self.group_data(group_df)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .pipe(self.sort_df)
-                .to_dicts()
-            )
-            filtered_records = [
-                {
-                    **{
-                        key: record[key]
-                        for key in record
-                        if key in self.column_mappings
-                    },
-                    'asset_id': record.get('asset_id', None)
-                }
-                for record in records
-            ]
+            .pipe(self.sort_df),
+        ])
+        overall_summary = overall_df.row(0, named=True)
+        filtered_records = self._to_records(records_df)
 
         return {
             "report_type": "instantaneous",
@@ -1,60 +1,37 @@
 from typing import Dict, Any
-from datetime import datetime
 
 from ..builders.base import BaseReportBuilder
 
+# Calendar columns below the month level are not grouped on within a month
+_MONTH_EXCLUDED_GROUP_COLUMNS = frozenset(
+    {"day", "month", "year", "date", "week_of_month"})
+
 
 class MonthwiseReportBuilder(BaseReportBuilder):
     def prepare_response(self) -> Dict[str, Any]:
-        # Process overall summary in one chain
-        overall_summary = (
-            self._calculate_summary(self.df)
-            .pipe(self._add_calculated_columns)
-            .pipe(self.roundoff)
-            .to_dicts()[0]
-        )
+        month_keys = ["year", "month"]
+        record_group_columns = [
+            col for col in self.group_by_columns
+            if col not in _MONTH_EXCLUDED_GROUP_COLUMNS
+        ]
+
+        # Summaries and records of all months are calculated together
+        overall_summary, month_summaries, records_df = (
+            self._build_section_frames(month_keys, record_group_columns))
+        # Format the titles of all months at once
+        month_labels = self._format_date_labels(
+            records_df, {"title": "%B %Y"}, month_keys)
+        month_partitions = self._partition_records(
+            records_df, month_keys, record_group_columns)
 
         sections = []
-        # Process each month's data
-        for (year, month), month_group in self.df.group_by(["year", "month"]):
-            month_yr_str = f"{year:04d}-{month:02d}"
-
-            # Process month summary and records in chains
-            month_summary = (
-                self._calculate_summary(month_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .to_dicts()[0]
-            )
-            # remove unwanted columns from group by columns
-            for column in ["day", "month", "year", "date", "week_of_month"]:
-                try:
-                    self.group_by_columns.remove(column)
-                except ValueError:
-                    pass
-
-            records = (
-                self.group_data(month_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .pipe(self.sort_df)
-                .to_dicts()
-            )
-
-            filtered_records = [
-                {
-                    **{
-                        key: record[key]
-                        for key in record
-                        if key in self.column_mappings
-                    },
-                    'asset_id': record.get('asset_id', None)
-                }
-                for record in records
-            ]
+        # Process each month's data in (year, month) order
+        for year, month in sorted(month_partitions):
+            month_summary = month_summaries[(year, month)]
+            filtered_records = self._to_records(
+                month_partitions[(year, month)])
 
-            date_obj = datetime(year, month, 1)
-            month_yr_str = date_obj.strftime("%B %Y")
+            month_yr_str = month_labels[(year, month)]["title"]
 
             sections.append(
                 {
@@ -68,7 +45,7 @@ class MonthwiseReportBuilder(BaseReportBuilder):
 
         return {
             "report_type": "monthwise",
-            "sections": sorted(sections, key=lambda x: x["year_month"]),
+            "sections": sections,
             "summary_label": "overall summary",
             "summary": overall_summary,
             "column_header_mapping": self.column_mappings,
@@ -1,97 +1,109 @@
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, Tuple
+
+import polars as pl
 
 from ..builders.base import BaseReportBuilder
 
 
 class ShiftwiseReportBuilder(BaseReportBuilder):
+    _DAY_KEYS = ["year", "month", "day"]
+    _SHIFT_KEYS = ["shift_id", "platform_shift_id"]
+
     def prepare_response(self) -> Dict[str, Any]:
-        # Calculate overall summary once
-        overall_summary = (
-            self._calculate_summary(self.df)
+        day_keys = self._DAY_KEYS
+        shift_group_keys = day_keys + self._SHIFT_KEYS
+        lf = self.df.lazy()
+
+        # Day and shift summaries each come from one grouped pass
+        day_summaries_lf = self._calculate_summary(lf, day_keys)
+        if self._summary_is_additive():
+            # Days partition the data, so the overall summary is their sum
+            overall_lf = self._rollup_summary(day_summaries_lf, day_keys)
+        else:
+            overall_lf = self._calculate_summary(lf)
+        shift_summaries_lf = self._calculate_summary(lf, shift_group_keys)
+
+        overall_df, day_summaries_df, shift_summaries_df = self._collect_all([
+            summary_lf
             .pipe(self._add_calculated_columns)
             .pipe(self.roundoff)
-            .to_dicts()[0]
-        )
+            for summary_lf in (
+                overall_lf, day_summaries_lf, shift_summaries_lf)
+        ])
+        overall_summary = overall_df.row(0, named=True)
+        day_summaries = self._rows_by_key(day_summaries_df, day_keys)
+        shift_summaries = self._rows_by_key(
+            shift_summaries_df, shift_group_keys)
+        # Format the date labels of all days at once
+        day_labels = self._format_date_labels(
+            self.df, {"date": "%Y-%m-%d", "title": "%d %b %Y"})
 
-        sections = []
-        # Process each day's data
-        for (year, month, day), day_group in self.df.group_by(
-                ["year", "month", "day"]):
-            date_str = f"{year:04d}-{month:02d}-{day:02d}"
-
-            # Calculate day summary
-            day_summary = (
-                self._calculate_summary(day_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .to_dicts()[0]
-            )
+        # Days are independent, so their sections are built concurrently
+        # and come back in (year, month, day) order
+        day_groups = self.df.partition_by(day_keys, as_dict=True)
+        sections = self._map_groups(
+            self._build_day_section,
+            [
+                (day_key, day_groups[day_key], day_labels[day_key],
+                 day_summaries[day_key], shift_summaries)
+                for day_key in sorted(day_groups)
+            ]
+        )
 
-            subsections = []
-            # Process each subgroup within the day
-            for (shift_id, p_shift_id), group_df in day_group.group_by(
-                    ["shift_id", "platform_shift_id"]):
-                # Process group records
-                records = (
-                    self.group_data(group_df)
-                    .pipe(self._add_calculated_columns)
-                    .pipe(self.roundoff)
-                    .pipe(self.sort_df)
-                    .to_dicts()
-                )
+        return {
+            "report_type": "monthwise",
+            "sections": sections,
+            "summary_label": "overall summary",
+            "summary": overall_summary,
+            "column_header_mapping": self.column_mappings,
+        }
 
-                filtered_records = [
-                    {
-                        **{
-                            key: record[key]
-                            for key in record
-                            if key in self.column_mappings
-                        },
-                        'asset_id': record.get('asset_id', None)
-                    }
-                    for record in records
-                ]
+    def _build_day_section(
+        self,
+        day_key: Tuple[int, int, int],
+        day_group: pl.DataFrame,
+        day_labels: Dict[str, str],
+        day_summary: Dict[str, Any],
+        shift_summaries: Dict[Tuple[Any, ...], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the section of one day from that day's rows."""
+        shift_keys = self._SHIFT_KEYS
 
-                # Process group summary
-                group_summary = (
-                    self._calculate_summary(group_df)
-                    .pipe(self._add_calculated_columns)
-                    .pipe(self.roundoff)
-                    .to_dicts()[0]
-                )
+        # Group, calculate and sort the records of all shifts at once
+        day_records = (
+            self.group_data(day_group, extra_keys=shift_keys)
+            .pipe(self._calculate_columns)
+            .pipe(self.sort_df)
+        )
+        shift_partitions = self._partition_records(day_records, shift_keys)
 
-                # Format group title
-                group_title = self.shift_mapping.get(p_shift_id, p_shift_id)
-                group_title = f"{group_title}"
+        subsections = []
+        # Process each subgroup within the day in shift_id order
+        for shift_id, p_shift_id in sorted(
+                shift_partitions, key=lambda shift_key: shift_key[0]):
+            filtered_records = self._to_records(
+                shift_partitions[(shift_id, p_shift_id)])
+            group_summary = shift_summaries[day_key + (shift_id, p_shift_id)]
 
-                subsections.append(
-                    {
-                        "title": group_title,
-                        "records": filtered_records,
-                        "summary_label": f"{group_title} summary",
-                        "summary": group_summary,
-                        "shift_id": shift_id
-                    }
-                )
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%d %b %Y")
+            # Format group title
+            group_title = self.shift_mapping.get(p_shift_id, p_shift_id)
+            group_title = f"{group_title}"
 
-            subsections = sorted(subsections, key=lambda x: x["shift_id"])
-            sections.append(
+            subsections.append(
                 {
-                    "title": formatted_date,
-                    "subsections": subsections,
-                    "summary_label": f"{formatted_date} summary",
-                    "summary": day_summary,
-                    "date": date_str
+                    "title": group_title,
+                    "records": filtered_records,
+                    "summary_label": f"{group_title} summary",
+                    "summary": group_summary,
+                    "shift_id": shift_id
                 }
             )
+        date_str, formatted_date = day_labels["date"], day_labels["title"]
 
         return {
-            "report_type": "monthwise",
-            "sections": sorted(sections, key=lambda x: x["date"]),
-            "summary_label": "overall summary",
-            "summary": overall_summary,
-            "column_header_mapping": self.column_mappings,
+            "title": formatted_date,
+            "subsections": subsections,
+            "summary_label": f"{formatted_date} summary",
+            "summary": day_summary,
+            "date": date_str
         }
@@ -1,82 +1,92 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import calendar
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+import polars as pl
+
 from ..builders.base import BaseReportBuilder
 
+# Calendar columns below the week level are not grouped on within a week
+_WEEK_EXCLUDED_GROUP_COLUMNS = frozenset({"day", "month", "year", "date"})
+
+
+@lru_cache(maxsize=4096)
+def _week_range(year: int, month: int, week_no: int) -> str:
+    """Convert week number to date range string."""
+    # Get month details
+    _, num_days_in_month = calendar.monthrange(year, month)
+    first_day_date = datetime(year, month, 1)
+
+    # Calculate week dates
+    start_of_week = first_day_date + timedelta(days=(week_no - 1) * 7)
+    if start_of_week.month != month:
+        return "Invalid week number for the given month"
+
+    # Calculate end date with month boundary check
+    end_of_week = min(
+        start_of_week +
+        timedelta(days=6), datetime(year, month, num_days_in_month)
+    )
+    result = f"Week {week_no} - ({start_of_week.strftime('%d %b')} - " \
+             f"{end_of_week.strftime('%d %b %Y')})"
+    return result
+
 
 class WeekwiseReportBuilder(BaseReportBuilder):
     def week_to_day_range(self, year: int, month: int, week_no: int) -> str:
         """Convert week number to date range string."""
-        # Get month details
-        _, num_days_in_month = calendar.monthrange(year, month)
-        first_day_date = datetime(year, month, 1)
-
-        # Calculate week dates
-        start_of_week = first_day_date + timedelta(days=(week_no - 1) * 7)
-        if start_of_week.month != month:
-            return "Invalid week number for the given month"
-
-        # Calculate end date with month boundary check
-        end_of_week = min(
-            start_of_week +
-            timedelta(days=6), datetime(year, month, num_days_in_month)
+        return _week_range(year, month, week_no)
+
+    def _week_titles(
+        self,
+        df: pl.DataFrame
+    ) -> Dict[Tuple[Any, ...], Dict[str, str]]:
+        """Compute week_to_day_range for every distinct week at once."""
+        week_keys = ["year", "month", "week_of_month"]
+        month_start = pl.date(pl.col("year"), pl.col("month"), 1)
+        week_start = month_start + pl.duration(
+            days=(pl.col("week_of_month") - 1) * 7)
+        week_end = pl.min_horizontal(
+            week_start + pl.duration(days=6), month_start.dt.month_end())
+        title = pl.format(
+            "Week {} - ({} - {})",
+            pl.col("week_of_month"),
+            week_start.dt.strftime("%d %b"),
+            week_end.dt.strftime("%d %b %Y"),
+        )
+        titles_df = df.select(week_keys).unique().with_columns(
+            pl.when(week_start.dt.month() == pl.col("month"))
+            .then(title)
+            .otherwise(pl.lit("Invalid week number for the given month"))
+            .alias("title")
         )
-        result = f"Week {week_no} - ({start_of_week.strftime('%d %b')} - " \
-                 f"{end_of_week.strftime('%d %b %Y')})"
-        return result
+        return self._rows_by_key(titles_df, week_keys)
 
     def prepare_response(self) -> Dict[str, Any]:
-        # Process overall summary in one chain
-        overall_summary = (
-            self._calculate_summary(self.df)
-            .pipe(self._add_calculated_columns)
-            .pipe(self.roundoff)
-            .to_dicts()[0]
-        )
+        week_keys = ["year", "month", "week_of_month"]
+        record_group_columns = [
+            col for col in self.group_by_columns
+            if col not in _WEEK_EXCLUDED_GROUP_COLUMNS
+        ]
+
+        # Summaries and records of all weeks are calculated together
+        overall_summary, week_summaries, records_df = (
+            self._build_section_frames(week_keys, record_group_columns))
+        # Format the titles of all weeks at once
+        week_titles = self._week_titles(records_df)
+        week_partitions = self._partition_records(
+            records_df, week_keys, record_group_columns)
 
         sections = []
-        # Process each week's data
-        for (year, month, week), week_group in self.df.group_by(
-            ["year", "month", "week_of_month"]
-        ):
+        # Process each week's data in (year, month, week) order
+        for year, month, week in sorted(week_partitions):
             # Get week range string
-            week_str = self.week_to_day_range(year, month, week)
-
-            # Process week summary and records in chains
-            week_summary = (
-                self._calculate_summary(week_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .to_dicts()[0]
-            )
-
-            # remove unwanted columns from group by columns
-            for column in ["day", "month", "year", "date"]:
-                try:
-                    self.group_by_columns.remove(column)
-                except ValueError:
-                    pass
-
-            records = (
-                self.group_data(week_group)
-                .pipe(self._add_calculated_columns)
-                .pipe(self.roundoff)
-                .pipe(self.sort_df)
-                .to_dicts()
-            )
+            week_str = week_titles[(year, month, week)]["title"]
 
-            filtered_records = [
-                {
-                    **{
-                        key: record[key]
-                        for key in record
-                        if key in self.column_mappings
-                    },
-                    'asset_id': record.get('asset_id', None)
-                }
-                for record in records
-            ]
+            week_summary = week_summaries[(year, month, week)]
+            filtered_records = self._to_records(
+                week_partitions[(year, month, week)])
 
             sections.append(
                 {
@@ -90,10 +100,6 @@ class WeekwiseReportBuilder(BaseReportBuilder):
                 }
             )
 
-        # Sort sections by year, month, and week
-        sections.sort(key=lambda x: (
-            x["year"], x["month"], x["week_of_month"]))
-
         return {
             "report_type": "weekwise",
             "sections": sections,
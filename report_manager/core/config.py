@@ -1,10 +1,23 @@
-from typing import Dict, Any, List, Optional, Set, Union
-from pydantic import BaseModel, Field, validator
+from typing import (
+    Dict, Any, List, Optional, Set, FrozenSet, Tuple, Union, Callable,
+    BinaryIO, Sequence
+)
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 import yaml
 import json
-from pathlib import Path
 import copy
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..utils.defaults import DEFAULT_GROUPING_COLUMNS, MANDATORY_DB_COLUMNS
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON parser
+    orjson = None
 
 
 class ReportType(str, Enum):
@@ -33,6 +46,8 @@ class GroupingType(str, Enum):
     FIRST_VALUE = "first_value"
 
 
+# Section entries are immutable values; derive variants with
+# model_copy(update=...)
 class ColumnConfig(BaseModel):
     name: str
     unit: Optional[str] = None
@@ -41,9 +56,8 @@ class ColumnConfig(BaseModel):
     sort_order: int = 0
     grouping_type: Optional[GroupingType] = None
 
-    class Config:
-        extra = "allow"
-        use_enum_values = True
+    model_config = ConfigDict(
+        extra="allow", use_enum_values=True, frozen=True)
 
 
 class FormulaConfig(BaseModel):
@@ -51,6 +65,8 @@ class FormulaConfig(BaseModel):
     parameters: Dict[str, str]
     constants: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class DepartmentConfig(BaseModel):
     product_column: str
@@ -58,6 +74,8 @@ class DepartmentConfig(BaseModel):
     default_grouping_columns: List[str] = Field(default_factory=list)
     category_mappings: Optional[Dict[str, Dict[str, Any]]] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ReportBuilderConfig(BaseModel):
     builder_class: str
@@ -65,6 +83,8 @@ class ReportBuilderConfig(BaseModel):
     optional_columns: List[str] = Field(default_factory=list)
     default_aggregations: Optional[Dict[str, List[str]]] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ReportConfig(BaseModel):
     """Main configuration class for the report manager."""
@@ -75,21 +95,9 @@ class ReportConfig(BaseModel):
     column_definitions: Dict[str, ColumnConfig] = Field(default_factory=dict)
     formulas: Dict[str, FormulaConfig] = Field(default_factory=dict)
 
-    # Default column groupings
-    default_grouping_columns: Set[str] = Field(
-        default_factory=lambda: {
-            "date", "lot_number", "asset_id", "machine_name"
-        }
-    )
-    mandatory_db_columns: Set[str] = Field(
-        default_factory=lambda: {
-            "date",
-            "shift_id",
-            "platform_shift_id",
-            "lot_number",
-            "asset_id"
-        }
-    )
+    # Default column groupings, shared by every instance
+    default_grouping_columns: FrozenSet[str] = DEFAULT_GROUPING_COLUMNS
+    mandatory_db_columns: FrozenSet[str] = MANDATORY_DB_COLUMNS
 
     # Global settings
     precision_defaults: Dict[str, int] = Field(default_factory=dict)
@@ -106,92 +114,9 @@ class ReportConfig(BaseModel):
     first_value_columns: List[str] = Field(default_factory=list)
     summary_columns: List[str] = Field(default_factory=list)
 
-    class Config:
-        extra = "allow"
-        use_enum_values = True
-
-    def __init__(self, **data):
-        # Handle the case where multiple dictionaries are merged using **kwargs
-        # Extract known top-level lists that might be passed directly
-        if 'grouping_columns' in data:
-            grouping_columns = data.pop('grouping_columns')
-        else:
-            grouping_columns = []
-
-        if 'aggregation_columns' in data:
-            aggregation_columns = data.pop('aggregation_columns')
-        else:
-            aggregation_columns = []
-
-        if 'average_columns' in data:
-            average_columns = data.pop('average_columns')
-        else:
-            average_columns = []
-
-        if 'counting_columns' in data:
-            counting_columns = data.pop('counting_columns')
-        else:
-            counting_columns = []
-
-        if 'simple_counting_columns' in data:
-            simple_counting_columns = data.pop('simple_counting_columns')
-        else:
-            simple_counting_columns = []
-
-        if 'first_value_columns' in data:
-            first_value_columns = data.pop('first_value_columns')
-        else:
-            first_value_columns = []
-
-        if 'summary_columns' in data:
-            summary_columns = data.pop('summary_columns')
-        else:
-            summary_columns = []
-
-        super().__init__(
-            grouping_columns=grouping_columns,
-            aggregation_columns=aggregation_columns,
-            average_columns=average_columns,
-            counting_columns=counting_columns,
-            simple_counting_columns=simple_counting_columns,
-            first_value_columns=first_value_columns,
-            summary_columns=summary_columns,
-            **data
-        )
-
-    @validator('departments', pre=True)
-    def validate_departments(cls, v):
-        if isinstance(v, dict):
-            return {
-                k: DepartmentConfig(**val)
-                if isinstance(val, dict) else val
-                for k, val in v.items()
-            }
-        return v
-
-    @validator('report_types', pre=True)
-    def validate_report_types(cls, v):
-        if isinstance(v, dict):
-            return {
-                k: ReportBuilderConfig(**val)
-                if isinstance(val, dict) else val
-                for k, val in v.items()
-            }
-        return v
-
-    @validator('column_definitions', pre=True)
-    def validate_column_definitions(cls, v):
-        if isinstance(v, dict):
-            return {k: ColumnConfig(**val) if isinstance(val, dict) else val
-                    for k, val in v.items()}
-        return v
-
-    @validator('formulas', pre=True)
-    def validate_formulas(cls, v):
-        if isinstance(v, dict):
-            return {k: FormulaConfig(**val) if isinstance(val, dict) else val
-                    for k, val in v.items()}
-        return v
+    # Nested section values are validated into their models by
+    # pydantic-core; missing list fields fall back to their defaults
+    model_config = ConfigDict(extra="allow", use_enum_values=True)
 
     def get_columns_by_grouping_type(
         self,
@@ -240,6 +165,74 @@ class ReportConfig(BaseModel):
 
         return summary_cols
 
+    def get_column_mappings(self) -> Dict[str, Dict[str, Any]]:
+        """Get the name, sort order and unit of every defined column."""
+        return {
+            col_name: {
+                "name": col_config.name,
+                "sort_order": col_config.sort_order,
+                "unit": col_config.unit
+            }
+            for col_name, col_config in self.column_definitions.items()
+        }
+
+    def get_formula_mappings(self) -> List[Dict[str, Any]]:
+        """Get formulas in the mapping form used by report builders."""
+        return [
+            {
+                "column_name": formula_name,
+                "formula": formula_config.formula,
+                "paramColumnMap": formula_config.parameters,
+                "paramConstMap": formula_config.constants or {}
+            }
+            for formula_name, formula_config in self.formulas.items()
+        ]
+
+
+# libyaml's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Directory and multi-file loads read files concurrently from this many on
+_PARALLEL_LOAD_MIN_FILES = 4
+_PARALLEL_LOAD_MAX_WORKERS = 8
+
+_CONFIG_EXTENSIONS = frozenset({"yaml", "yml", "json"})
+
+# Files at least this large are memory-mapped rather than read into memory
+_MMAP_MIN_SIZE = 256 * 1024
+
+
+def _parse_json(f: BinaryIO) -> Dict[str, Any]:
+    """Parse a binary JSON stream, with orjson when it is installed."""
+    if orjson is None:
+        return json.load(f)
+    if isinstance(f, mmap.mmap):
+        # orjson parses the mapped pages in place
+        with memoryview(f) as buffer:
+            return orjson.loads(buffer)
+    return orjson.loads(f.read())
+
+
+def _parse_yaml(f: BinaryIO) -> Dict[str, Any]:
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+def _read_config_file(
+    file_path: Path,
+    parse: Callable[[BinaryIO], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Parse a config file, memory-mapping it when it is large."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return parse(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse(mapped)
+
+
+_CONFIG_CACHE_SIZE = 32
+# Keyed by resolved path and modification time, so edited files reload
+_FILE_CACHE: Dict[Tuple[str, int], ReportConfig] = {}
+
 
 class ConfigLoader:
     """Utility class for loading configurations from various sources."""
@@ -247,31 +240,56 @@ class ConfigLoader:
     @staticmethod
     def from_dict(config_dict: Dict[str, Any]) -> ReportConfig:
         """Load configuration from a dictionary."""
-        return ReportConfig(**config_dict)
+        return ReportConfig.model_validate(config_dict)
 
     @staticmethod
     def from_yaml(yaml_path: Union[str, Path]) -> ReportConfig:
         """Load configuration from a YAML file."""
-        with open(yaml_path, 'r') as f:
-            config_dict = yaml.safe_load(f)
-        return ConfigLoader.from_dict(config_dict)
+        return ConfigLoader._from_cached_file(yaml_path, _parse_yaml)
 
     @staticmethod
     def from_json(json_path: Union[str, Path]) -> ReportConfig:
         """Load configuration from a JSON file."""
-        with open(json_path, 'r') as f:
-            config_dict = json.load(f)
-        return ConfigLoader.from_dict(config_dict)
+        return ConfigLoader._from_cached_file(json_path, _parse_json)
+
+    @staticmethod
+    def _from_cached_file(
+        file_path: Union[str, Path],
+        parse: Callable[[BinaryIO], Dict[str, Any]]
+    ) -> ReportConfig:
+        """
+        Parse and validate a file, reusing the result while unchanged.
+
+        Each call gets its own deep copy of the cached configuration, which
+        is still several times cheaper than reading and validating again.
+        """
+        file_path = Path(file_path).resolve()
+        cache_key = (str(file_path), file_path.stat().st_mtime_ns)
+        config = _FILE_CACHE.get(cache_key)
+        if config is None:
+            config = ConfigLoader.from_dict(
+                _read_config_file(file_path, parse))
+            if len(_FILE_CACHE) >= _CONFIG_CACHE_SIZE:
+                del _FILE_CACHE[next(iter(_FILE_CACHE))]
+            _FILE_CACHE[cache_key] = config
+        return config.model_copy(deep=True)
 
     @staticmethod
     def merge_configs(
         base_config: ReportConfig,
         override_config: Dict[str, Any]
     ) -> ReportConfig:
-        """Merge base configuration with overrides."""
-        base_dict = base_config.dict()
-        base_dict.update(override_config)
-        return ConfigLoader.from_dict(base_dict)
+        """
+        Merge base configuration with overrides.
+
+        Overrides replace whole top-level settings. Only the overridden
+        settings are validated; the others are deep-copied from
+        base_config, so editing the result never changes the base.
+        """
+        overrides = ReportConfig.model_validate(override_config)
+        return base_config.model_copy(deep=True, update={
+            key: getattr(overrides, key) for key in override_config
+        })
 
     @staticmethod
     def _load_file(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -282,16 +300,31 @@ class ConfigLoader:
             raise FileNotFoundError(
                 f"Configuration file not found: {file_path}")
 
-        with open(file_path, 'r') as f:
-            if file_path.suffix.lower() in ['.yml', '.yaml']:
-                return yaml.safe_load(f) or {}
-            elif file_path.suffix.lower() == '.json':
-                return json.load(f)
-            else:
-                raise ValueError(
-                    f"Unsupported file format: {file_path.suffix}. "
-                    "Only .yaml, .yml, and .json are supported."
-                )
+        if file_path.suffix.lower() in ['.yml', '.yaml']:
+            return _read_config_file(file_path, _parse_yaml) or {}
+        elif file_path.suffix.lower() == '.json':
+            return _read_config_file(file_path, _parse_json)
+        else:
+            raise ValueError(
+                f"Unsupported file format: {file_path.suffix}. "
+                "Only .yaml, .yml, and .json are supported."
+            )
+
+    @staticmethod
+    def _load_files(
+        file_paths: Sequence[Union[str, Path]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Load several configuration files, keeping their order.
+
+        Larger batches are read on a small thread pool so file reads
+        overlap; merging stays sequential in the caller.
+        """
+        if len(file_paths) < _PARALLEL_LOAD_MIN_FILES:
+            return [ConfigLoader._load_file(path) for path in file_paths]
+        max_workers = min(_PARALLEL_LOAD_MAX_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(ConfigLoader._load_file, file_paths))
 
     @staticmethod
     def _deep_merge_dicts(
@@ -299,25 +332,30 @@ class ConfigLoader:
         override: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Deep merge two dictionaries,
-        with override values taking precedence."""
-        result = copy.deepcopy(base)
+        with override values taking precedence.
+
+        Neither input is modified and the result shares no mutable values
+        with them. Each value is copied once as it is placed in the result,
+        instead of deep-copying the base at every level of the merge.
+        """
+        result = {
+            key: copy.deepcopy(value)
+            for key, value in base.items() if key not in override
+        }
 
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) \
-                    and isinstance(value, dict):
-                result[key] = ConfigLoader._deep_merge_dicts(
-                    result[key], value)
-            elif key in result and isinstance(result[key], list) \
-                    and isinstance(value, list):
+            current = base.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                result[key] = ConfigLoader._deep_merge_dicts(current, value)
+            elif isinstance(current, list) and isinstance(value, list):
                 # For lists, extend the base list
                 # with override values (avoiding duplicates)
-                result[key] = list(dict.fromkeys(result[key] + value))
-            elif key in result and isinstance(result[key], set) \
-                    and isinstance(value, (set, list)):
+                result[key] = copy.deepcopy(
+                    list(dict.fromkeys(current + value)))
+            elif isinstance(current, (set, frozenset)) \
+                    and isinstance(value, (set, frozenset, list)):
                 # For sets, union with override values
-                if isinstance(value, list):
-                    value = set(value)
-                result[key] = result[key].union(value)
+                result[key] = current.union(value)
             else:
                 result[key] = copy.deepcopy(value)
 
@@ -351,12 +389,11 @@ class ConfigLoader:
                 "merge_strategy must be either 'deep' or 'shallow'")
 
         # Load the first file as base
-        merged_config = ConfigLoader._load_file(file_paths[0])
+        config_dicts = ConfigLoader._load_files(file_paths)
+        merged_config = config_dicts[0]
 
         # Merge remaining files
-        for file_path in file_paths[1:]:
-            config_dict = ConfigLoader._load_file(file_path)
-
+        for config_dict in config_dicts[1:]:
             if merge_strategy == "deep":
                 merged_config = ConfigLoader._deep_merge_dicts(
                     merged_config, config_dict)
@@ -416,10 +453,13 @@ class ConfigLoader:
         if not directory_path.is_dir():
             raise ValueError(f"Path is not a directory: {directory_path}")
 
-        # Find all matching files
-        config_files = []
-        for ext in ['yaml', 'yml', 'json']:
-            config_files.extend(directory_path.glob(f"*.{ext}"))
+        # Find all matching files in a single directory scan
+        with os.scandir(directory_path) as entries:
+            config_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file() and
+                entry.name.rpartition('.')[2].lower() in _CONFIG_EXTENSIONS
+            ]
 
         if not config_files:
             raise ValueError(
@@ -452,6 +492,8 @@ class ConfigLoader:
         # Process first source
         first_source = sources[0]
         if isinstance(first_source, dict):
+            # Copied so the loaded config never shares values with the
+            # caller's dictionary
             merged_config = copy.deepcopy(first_source)
         else:
             merged_config = ConfigLoader._load_file(first_source)
@@ -467,6 +509,6 @@ class ConfigLoader:
                 merged_config = ConfigLoader._deep_merge_dicts(
                     merged_config, config_dict)
             else:  # shallow merge
-                merged_config.update(config_dict)
+                merged_config.update(copy.deepcopy(config_dict))
 
         return ConfigLoader.from_dict(merged_config)
@@ -1,10 +1,12 @@
 import polars as pl
-from typing import Dict, Any, List, Optional, Set, Type, Union
-from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, FrozenSet, Type, Union
 import importlib
 import logging
+from functools import lru_cache
 
-from .config import ReportConfig, ReportType, ReportCategory, GroupingType
+from .config import (
+    ReportConfig, ReportType, ReportCategory, GroupingType, DepartmentConfig
+)
 from .filter import ReportFilter
 from ..builders.base import BaseReportBuilder
 from ..exceptions.report_exceptions import (
@@ -12,6 +14,48 @@ from ..exceptions.report_exceptions import (
     ReportBuilderNotFoundError
 )
 
+logger = logging.getLogger(__name__)
+
+# Column sets added or removed per report category and type
+_MACHINE_COLUMNS = frozenset({"asset_id", "machine_name"})
+_SHIFT_COLUMNS = frozenset({"shift_id", "platform_shift_id"})
+_MACHINE_COUNTING_CATEGORIES = frozenset(
+    {ReportCategory.COUNTWISE, ReportCategory.HANKWISE})
+_SHIFT_REPORT_TYPES = frozenset(
+    {ReportType.SHIFTWISE, ReportType.INSTANTANEOUS})
+
+_DEFAULT_BUILDERS: Dict[ReportType, str] = {
+    ReportType.DAYWISE:
+        "report_manager.builders.daywise.DaywiseReportBuilder",
+    ReportType.WEEKWISE:
+        "report_manager.builders.weekwise.WeekwiseReportBuilder",
+    ReportType.MONTHWISE:
+        "report_manager.builders.monthwise.MonthwiseReportBuilder",
+    ReportType.SHIFTWISE:
+        "report_manager.builders.shiftwise.ShiftwiseReportBuilder",
+    ReportType.INSTANTANEOUS:
+    "report_manager.builders.instantaneous.InstantaneousReportBuilder"
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve_builder(builder_path: str) -> Type[BaseReportBuilder]:
+    """Import a builder class from its dotted path, once per process."""
+    module_path, class_name = builder_path.rsplit('.', 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
+@lru_cache(maxsize=None)
+def _builder_settings(
+    builder_class: Type[BaseReportBuilder]
+) -> FrozenSet[str]:
+    """Names accepted by builder_class.configure, from its set_ methods."""
+    return frozenset(
+        name[len("set_"):] for name in dir(builder_class)
+        if name.startswith("set_") and callable(getattr(builder_class, name))
+    )
+
 
 class ReportManager:
     """
@@ -27,26 +71,13 @@ class ReportManager:
 
     def _register_default_builders(self):
         """Register default report builders."""
-        default_builders = {
-            ReportType.DAYWISE:
-                "report_manager.builders.daywise.DaywiseReportBuilder",
-            ReportType.WEEKWISE:
-                "report_manager.builders.weekwise.WeekwiseReportBuilder",
-            ReportType.MONTHWISE:
-                "report_manager.builders.monthwise.MonthwiseReportBuilder",
-            ReportType.SHIFTWISE:
-                "report_manager.builders.shiftwise.ShiftwiseReportBuilder",
-            ReportType.INSTANTANEOUS:
-            "report_manager.builders.instantaneous.InstantaneousReportBuilder"
-        }
-
-        for report_type, builder_path in default_builders.items():
+        for report_type, builder_path in _DEFAULT_BUILDERS.items():
             try:
                 self.register_builder(report_type.value, builder_path)
             except ImportError as e:
-                logging.warning(
-                    f"Could not register default builder "
-                    f"for {report_type}: {e}"
+                logger.warning(
+                    "Could not register default builder for %s: %s",
+                    report_type, e
                 )
 
     def register_builder(
@@ -56,14 +87,11 @@ class ReportManager:
     ):
         """Register a custom report builder."""
         if isinstance(builder_class, str):
-            # Dynamic import
-            module_path, class_name = builder_class.rsplit('.', 1)
-            module = importlib.import_module(module_path)
-            builder_class = getattr(module, class_name)
+            # Dynamic import, resolved once and shared by all managers
+            builder_class = _resolve_builder(builder_class)
 
         self._builder_registry[report_type] = builder_class
 
-    @lru_cache(maxsize=32)
     def _validate_department(self, department: str) -> None:
         """Validate department configuration."""
         if department not in self.config.departments:
@@ -118,7 +146,6 @@ class ReportManager:
         first_value_columns: Set[str]
     ) -> Dict[str, Any]:
         """Prepare column configuration based on department and category."""
-
         department_config = self.config.departments.get(
             filter_params.department_id)
         if not department_config:
@@ -130,48 +157,39 @@ class ReportManager:
         # Get columns from column definitions
         column_groups = self._get_columns_by_type()
 
-        # Merge with provided columns (provided columns take precedence)
-        final_grouping_columns = set(self.config.default_grouping_columns)
-        final_grouping_columns.update(column_groups["grouping_columns"])
-        final_grouping_columns.update(grouping_columns)
-
-        final_aggregation_columns = set(column_groups["aggregation_columns"])
-        final_aggregation_columns.update(aggregation_columns)
-
-        final_average_columns = set(column_groups["average_columns"])
-        final_average_columns.update(average_columns)
-
-        final_counting_columns = set(column_groups["counting_columns"])
-        final_counting_columns.update(counting_columns)
-
-        final_simple_counting_columns = set(
-            column_groups["simple_counting_columns"])
-        final_simple_counting_columns.update(simple_counting_columns)
-
-        final_first_value_columns = set(column_groups["first_value_columns"])
-        final_first_value_columns.update(first_value_columns)
+        # Merge with provided columns (provided columns take precedence);
+        # union() also accepts provided lists
+        final_grouping_columns = self.config.default_grouping_columns.union(
+            column_groups["grouping_columns"], grouping_columns)
+        final_aggregation_columns = column_groups["aggregation_columns"].union(
+            aggregation_columns)
+        final_average_columns = column_groups["average_columns"].union(
+            average_columns)
+        final_counting_columns = column_groups["counting_columns"].union(
+            counting_columns)
+        final_simple_counting_columns = column_groups[
+            "simple_counting_columns"].union(simple_counting_columns)
+        final_first_value_columns = column_groups["first_value_columns"].union(
+            first_value_columns)
 
         # Add department-specific product column
-        if department_config.product_column:
-            final_grouping_columns.add(department_config.product_column)
+        product_columns = (
+            frozenset({department_config.product_column})
+            if department_config.product_column else frozenset()
+        )
+        final_grouping_columns |= product_columns
 
         # Handle category-specific configurations
-        machine_columns = {"asset_id", "machine_name"}
-
-        if filter_params.category in \
-                [ReportCategory.COUNTWISE, ReportCategory.HANKWISE]:
-            final_counting_columns.update(machine_columns)
-            final_grouping_columns -= machine_columns
+        if filter_params.category in _MACHINE_COUNTING_CATEGORIES:
+            final_counting_columns |= _MACHINE_COLUMNS
+            final_grouping_columns -= _MACHINE_COLUMNS
         elif filter_params.category == ReportCategory.LOTWISE:
-            final_counting_columns.update(machine_columns)
-            if department_config.product_column:
-                final_counting_columns.add(department_config.product_column)
+            final_counting_columns |= _MACHINE_COLUMNS | product_columns
             final_grouping_columns -= final_counting_columns
 
         # Add shift columns for shift-based reports
-        if filter_params.report_type in \
-                [ReportType.SHIFTWISE, ReportType.INSTANTANEOUS]:
-            final_grouping_columns.update({"shift_id", "platform_shift_id"})
+        if filter_params.report_type in _SHIFT_REPORT_TYPES:
+            final_grouping_columns |= _SHIFT_COLUMNS
 
         return {
             "grouping_columns": final_grouping_columns,
@@ -193,6 +211,16 @@ class ReportManager:
         if not department_config:
             return column_mappings
 
+        column_mappings.update(self._build_mandatory_mappings(
+            filter_params, department_config))
+        return column_mappings
+
+    def _build_mandatory_mappings(
+        self,
+        filter_params: ReportFilter,
+        department_config: DepartmentConfig
+    ) -> Dict[str, Any]:
+        """Build the category's mandatory column mappings."""
         # Get product column info
         product_column = department_config.product_column
         product_config = self.config.column_definitions.get(product_column)
@@ -244,11 +272,10 @@ class ReportManager:
                 "lot_number": {"name": "Lot name", "sort_order": -1}
             })
 
-        column_mappings.update(mandatory_mappings)
-        return column_mappings
+        return mandatory_mappings
 
     def generate_report(self,
-                        data_frame: pl.DataFrame,
+                        data_frame: Union[pl.DataFrame, pl.LazyFrame],
                         filter_params: Optional[ReportFilter] = None,
                         grouping_columns: Optional[Set[str]] = None,
                         aggregation_columns: Optional[Set[str]] = None,
@@ -258,12 +285,14 @@ class ReportManager:
                         first_value_columns: Optional[Set[str]] = None,
                         column_mappings: Optional[Dict[str, Any]] = None,
                         summary_columns: Optional[Set[str]] = None,
-                        **kwargs) -> Dict[str, Any]:
+                        **kwargs) -> Union[Dict[str, Any], str]:
         """
         Generate a report based on the provided parameters.
 
         Args:
-            data_frame: Input data for report generation
+            data_frame: Input data for report generation. A LazyFrame
+                (e.g. from pl.scan_csv) is collected only for the columns
+                the report uses.
             filter_params: Report filter parameters
             grouping_columns: Columns to group by
             aggregation_columns: Columns to aggregate
@@ -273,14 +302,20 @@ class ReportManager:
             first_value_columns: Columns to take first value
             column_mappings: Column property mappings
             summary_columns: Columns for summary calculations
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters, applied through the builder's
+                matching set_<name> method (e.g. output_format="json")
 
         Returns:
-            Generated report as dictionary
+            Generated report as dictionary, or as a JSON string when
+            output_format="json"
         """
 
-        if not isinstance(data_frame, pl.DataFrame) or data_frame.is_empty():
-            raise ValueError("data_frame must be a non-empty Polars DataFrame")
+        if not isinstance(data_frame, pl.LazyFrame) and (
+                not isinstance(data_frame, pl.DataFrame) or
+                data_frame.is_empty()):
+            raise ValueError(
+                "data_frame must be a non-empty Polars DataFrame "
+                "or a LazyFrame")
 
         # Use defaults from config if not provided
         grouping_columns = grouping_columns or set()
@@ -296,14 +331,7 @@ class ReportManager:
 
         # Prepare column mappings from column definitions
         if not column_mappings:
-            column_mappings = {
-                k: {
-                    "name": v.name,
-                    "sort_order": v.sort_order,
-                    "unit": v.unit
-                }
-                for k, v in self.config.column_definitions.items()
-            }
+            column_mappings = self.config.get_column_mappings()
 
         # Validate department if filter provided
         if filter_params and filter_params.department_id:
@@ -344,40 +372,43 @@ class ReportManager:
 
         # Create and configure builder
         builder = builder_class()
-        builder.set_dataframe(data_frame)
-        builder.set_constants_map(self.config.constants)
-
-        # Set formula mappings from config
-        formula_mappings = []
-        for formula_name, formula_config in self.config.formulas.items():
-            formula_mappings.append({
-                "column_name": formula_name,
-                "formula": formula_config.formula,
-                "paramColumnMap": formula_config.parameters,
-                "paramConstMap": formula_config.constants or {}
-            })
-        builder.set_formula_mappings(formula_mappings)
-
-        builder.set_column_mappings(column_mappings)
-        builder.set_shift_mapping(self.config.shift_mappings)
-        builder.set_group_by_columns(list(column_config["grouping_columns"]))
-        builder.set_average_columns(list(column_config["average_columns"]))
-        builder.set_first_select_columns(
-            list(column_config["first_value_columns"]))
-        builder.set_agg_columns(list(column_config["aggregation_columns"]))
-        builder.set_counting_columns(list(column_config["counting_columns"]))
-        builder.set_simple_counting_columns(
-            list(column_config["simple_counting_columns"]))
-        builder.set_summary_columns(summary_columns)
-
-        # Use precision from column definitions and legacy precision_defaults
-        builder.set_roundoff_columns(self.config.get_precision_defaults())
-
-        # Set any additional parameters from kwargs
-        for key, value in kwargs.items():
-            setter_method = f"set_{key}"
-            if hasattr(builder, setter_method):
-                getattr(builder, setter_method)(value)
+        if filter_params:
+            builder.set_date_range(
+                filter_params.start_date, filter_params.end_date)
+        settings = {
+            "dataframe": data_frame,
+            "constants_map": self.config.constants,
+            # Set formula mappings from config
+            "formula_mappings": self.config.get_formula_mappings(),
+            "column_mappings": column_mappings,
+            "shift_mapping": self.config.shift_mappings,
+            # Column sets are passed in sorted order, so every report built
+            # from the same configuration groups and aggregates columns
+            # identically
+            "group_by_columns": sorted(column_config["grouping_columns"]),
+            "average_columns": sorted(column_config["average_columns"]),
+            "first_select_columns":
+                sorted(column_config["first_value_columns"]),
+            "agg_columns": sorted(column_config["aggregation_columns"]),
+            "counting_columns": sorted(column_config["counting_columns"]),
+            "simple_counting_columns":
+                sorted(column_config["simple_counting_columns"]),
+            "summary_columns": summary_columns,
+            # Use precision from column definitions and legacy
+            # precision_defaults
+            "roundoff_columns": self.config.get_precision_defaults(),
+        }
+
+        builder.configure(**settings)
+
+        # Additional parameters apply through matching setters afterwards,
+        # so additive setters such as set_group_by_columns extend the
+        # configured columns instead of replacing them
+        known_settings = _builder_settings(builder_class)
+        builder.configure(**{
+            key: value for key, value in kwargs.items()
+            if key in known_settings
+        })
 
         return builder.build()
 
@@ -391,4 +422,4 @@ class ReportManager:
     ) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific department."""
         dept_config = self.config.departments.get(department_id)
-        return dept_config.dict() if dept_config else None
+        return dept_config.model_dump() if dept_config else None
@@ -1,7 +1,29 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import (
+    BaseModel, ConfigDict, TypeAdapter, computed_field, model_validator
+)
+from typing import Any, Dict, List, Literal, Optional, Union
+from datetime import date
 from .config import ReportType, ReportCategory
 
+# Accepted values, matching ReportType and ReportCategory; spelled out so
+# static type checkers can read them. Literal fields validate as plain
+# strings and store enum members as their values
+ReportTypeValue = Literal[
+    "hourwise",
+    "daywise",
+    "weekwise",
+    "monthwise",
+    "shiftwise",
+    "instantaneous",
+    "lotwise_consolidated",
+]
+ReportCategoryValue = Literal[
+    "countwise",
+    "hankwise",
+    "lotwise",
+    "machinewise",
+]
+
 
 class ReportFilter(BaseModel):
     """Filter parameters for report generation."""
@@ -9,12 +31,68 @@ class ReportFilter(BaseModel):
     department_id: Optional[str] = None
 
     # Report configuration
-    report_type: ReportType
-    category: ReportCategory
+    report_type: ReportTypeValue
+    category: ReportCategoryValue
     metrics_type: Optional[str] = None
 
-    # Special flags
-    is_instantaneous: bool = False
+    # Inclusive date range; rows outside it are dropped before processing
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    # Immutable and hashable; derive variants with .model_copy(update=...)
+    model_config = ConfigDict(frozen=True)
+
+    @computed_field
+    @property
+    def is_instantaneous(self) -> bool:
+        """Whether this is an instantaneous report, kept in model dumps."""
+        return self.report_type == ReportType.INSTANTANEOUS
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_is_instantaneous(cls, data: Any) -> Any:
+        """Reject an is_instantaneous input that disagrees with report_type."""
+        # Accepted when it matches, so model dumps validate back unchanged
+        if isinstance(data, dict) and "is_instantaneous" in data:
+            expected = data.get("report_type") == ReportType.INSTANTANEOUS
+            if data["is_instantaneous"] != expected:
+                raise ValueError(
+                    "is_instantaneous is derived from report_type and must "
+                    f"be {expected} for report_type "
+                    f"{data.get('report_type')!r}")
+        return data
+
+    @model_validator(mode="after")
+    def check_date_range(self) -> "ReportFilter":
+        """Reject a date range that ends before it starts."""
+        if self.start_date is not None and self.end_date is not None \
+                and self.start_date > self.end_date:
+            raise ValueError(
+                f"start_date {self.start_date} is after "
+                f"end_date {self.end_date}")
+        return self
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "ReportFilter":
+        """Parse and validate a JSON payload in a single pass."""
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def validate_many(
+        cls,
+        payloads: List[Dict[str, Any]]
+    ) -> List["ReportFilter"]:
+        """Validate a batch of filter payloads in one pydantic-core call."""
+        return _FILTER_LIST_ADAPTER.validate_python(payloads)
+
+    @classmethod
+    def validate_many_json(
+        cls,
+        raw: Union[str, bytes]
+    ) -> List["ReportFilter"]:
+        """Parse and validate a JSON array of filters in a single pass."""
+        return _FILTER_LIST_ADAPTER.validate_json(raw)
+
 
-    class Config:
-        use_enum_values = True
+# Built once; reused by every batch validation
+_FILTER_LIST_ADAPTER = TypeAdapter(List[ReportFilter])
@@ -1,20 +1,25 @@
-from typing import Set, Dict, Any
+from typing import FrozenSet, Dict, Any, Tuple
 
 # Default column sets
-DEFAULT_GROUPING_COLUMNS: Set[str] = {
+DEFAULT_GROUPING_COLUMNS: FrozenSet[str] = frozenset({
     "date",
     "lot_number",
     "asset_id",
     "machine_name"
-}
+})
 
-MANDATORY_DB_COLUMNS: Set[str] = {
+MANDATORY_DB_COLUMNS: FrozenSet[str] = frozenset({
     "date",
     "shift_id",
     "platform_shift_id",
     "lot_number",
     "asset_id"
-}
+})
+
+# Sorted once so every department entry lists columns in the same order
+_MANDATORY_COLUMN_ORDER: Tuple[str, ...] = tuple(sorted(MANDATORY_DB_COLUMNS))
+_GROUPING_COLUMN_ORDER: Tuple[str, ...] = tuple(
+    sorted(DEFAULT_GROUPING_COLUMNS))
 
 # Spinning Industry-specific defaults
 SPINNING_DEPARTMENT_PRODUCT_COLUMNS: Dict[str, str] = {
@@ -53,8 +58,8 @@ DEFAULT_REPORT_CONFIGS: Dict[str, Dict[str, Any]] = {
         "departments": {
             dept: {
                 "product_column": col,
-                "mandatory_columns": list(MANDATORY_DB_COLUMNS),
-                "default_grouping_columns": list(DEFAULT_GROUPING_COLUMNS)
+                "mandatory_columns": list(_MANDATORY_COLUMN_ORDER),
+                "default_grouping_columns": list(_GROUPING_COLUMN_ORDER)
             }
             for dept, col in SPINNING_DEPARTMENT_PRODUCT_COLUMNS.items()
         },
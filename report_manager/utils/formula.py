@@ -0,0 +1,240 @@
+import ast
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import polars as pl
+
+
+class UnsupportedFormulaError(Exception):
+    """Raised when a formula cannot be translated to a Polars expression."""
+    pass
+
+
+class _FormulaTranslator(ast.NodeVisitor):
+    """
+    Translate a formula AST into a native Polars expression.
+
+    Mirrors the semantics of the restricted ``eval`` environment used for
+    formulas: any division by zero or arithmetic on a missing (null)
+    value makes the whole result ``0.0``, while nulls in conditions are
+    falsy. Conditional branches only contribute those guards for rows
+    where the branch would actually be evaluated.
+    """
+
+    def __init__(
+        self,
+        param_column_map: Dict[str, str],
+        param_const_map: Dict[str, Any]
+    ) -> None:
+        self.param_column_map = param_column_map
+        self.param_const_map = param_const_map
+        self.guards: List[pl.Expr] = []
+
+    def _visit_scoped(self, node: ast.AST, condition: pl.Expr) -> pl.Expr:
+        """Visit a branch whose guards only apply where condition holds."""
+        outer_guards, self.guards = self.guards, []
+        try:
+            expr = self.visit(node)
+            branch_guards = self.guards
+        finally:
+            self.guards = outer_guards
+        if branch_guards:
+            self.guards.append(condition & pl.any_horizontal(branch_guards))
+        return expr
+
+    def _visit_operand(self, node: ast.AST) -> pl.Expr:
+        """Visit a value used in arithmetic, where None raises TypeError."""
+        expr = self.visit(node)
+        # Other nodes already guard their own null inputs
+        if isinstance(node, (ast.Name, ast.IfExp, ast.BoolOp)):
+            self.guards.append(expr.is_null())
+        return expr
+
+    def _visit_power(self, base: pl.Expr, exponent: pl.Expr) -> pl.Expr:
+        """Raise base to exponent, guarding the inputs eval() rejects."""
+        # 0 ** negative raises ZeroDivisionError and a negative base with a
+        # fractional exponent gives a complex number, which float() rejects
+        self.guards.append((base == 0) & (exponent < 0))
+        self.guards.append((base < 0) & (exponent != exponent.floor()))
+        return base.pow(exponent)
+
+    def _visit_truthy(self, node: ast.AST) -> pl.Expr:
+        """Visit a value used as a condition, where None is falsy."""
+        return (self.visit(node) != 0).fill_null(False)
+
+    def generic_visit(self, node: ast.AST) -> pl.Expr:
+        raise UnsupportedFormulaError(
+            f"Unsupported formula element: {type(node).__name__}")
+
+    def visit_Expression(self, node: ast.Expression) -> pl.Expr:
+        return self.visit(node.body)
+
+    def visit_Constant(self, node: ast.Constant) -> pl.Expr:
+        if not isinstance(node.value, (int, float)):
+            raise UnsupportedFormulaError(
+                f"Unsupported constant: {node.value!r}")
+        return pl.lit(float(node.value))
+
+    def visit_Name(self, node: ast.Name) -> pl.Expr:
+        # Constants shadow columns, matching the eval() namespace merge
+        if node.id in self.param_const_map:
+            value = self.param_const_map[node.id]
+            if not isinstance(value, (int, float)):
+                raise UnsupportedFormulaError(
+                    f"Non-numeric constant for '{node.id}': {value!r}")
+            return pl.lit(float(value))
+
+        if node.id in self.param_column_map:
+            return pl.col(self.param_column_map[node.id]).cast(
+                pl.Float64, strict=False)
+
+        raise UnsupportedFormulaError(f"Unknown name: {node.id}")
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> pl.Expr:
+        if isinstance(node.op, ast.Not):
+            return (~self._visit_truthy(node.operand)).cast(pl.Float64)
+        operand = self._visit_operand(node.operand)
+        if isinstance(node.op, ast.USub):
+            return -operand
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        return self.generic_visit(node.op)
+
+    def visit_BinOp(self, node: ast.BinOp) -> pl.Expr:
+        left = self._visit_operand(node.left)
+        right = self._visit_operand(node.right)
+
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, (ast.Div, ast.FloorDiv, ast.Mod)):
+            self.guards.append(right == 0)
+            if isinstance(node.op, ast.Div):
+                return left / right
+            if isinstance(node.op, ast.FloorDiv):
+                return left // right
+            return left % right
+        if isinstance(node.op, ast.Pow):
+            return self._visit_power(left, right)
+        return self.generic_visit(node.op)
+
+    def visit_Compare(self, node: ast.Compare) -> pl.Expr:
+        left = self._visit_operand(node.left)
+        result = None
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self._visit_operand(comparator)
+            if isinstance(op, ast.Lt):
+                comparison = left < right
+            elif isinstance(op, ast.LtE):
+                comparison = left <= right
+            elif isinstance(op, ast.Gt):
+                comparison = left > right
+            elif isinstance(op, ast.GtE):
+                comparison = left >= right
+            elif isinstance(op, ast.Eq):
+                comparison = left == right
+            elif isinstance(op, ast.NotEq):
+                comparison = left != right
+            else:
+                return self.generic_visit(op)
+            result = comparison if result is None else result & comparison
+            left = right
+        return result.cast(pl.Float64)
+
+    def visit_IfExp(self, node: ast.IfExp) -> pl.Expr:
+        truthy = self._visit_truthy(node.test)
+        body = self._visit_scoped(node.body, truthy)
+        orelse = self._visit_scoped(node.orelse, ~truthy)
+        return pl.when(truthy).then(body).otherwise(orelse)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> pl.Expr:
+        # Python's and/or return one of the operands, not a bool
+        result = self.visit(node.values[0])
+        for value in node.values[1:]:
+            truthy = (result != 0).fill_null(False)
+            if isinstance(node.op, ast.And):
+                operand = self._visit_scoped(value, truthy)
+                result = pl.when(truthy).then(operand).otherwise(result)
+            else:
+                operand = self._visit_scoped(value, ~truthy)
+                result = pl.when(truthy).then(result).otherwise(operand)
+        return result
+
+    def visit_Call(self, node: ast.Call) -> pl.Expr:
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            return self.generic_visit(node)
+
+        name = node.func.id
+        if name == "round" and len(node.args) in (1, 2):
+            decimals = 0
+            if len(node.args) == 2:
+                digits = node.args[1]
+                if not (isinstance(digits, ast.Constant) and
+                        isinstance(digits.value, int)):
+                    raise UnsupportedFormulaError(
+                        "round() precision must be an integer literal")
+                decimals = digits.value
+            return self._visit_operand(node.args[0]).round(decimals)
+
+        args = [self._visit_operand(arg) for arg in node.args]
+        if name == "abs" and len(args) == 1:
+            return args[0].abs()
+        if name == "min" and len(args) >= 2:
+            return pl.min_horizontal(args)
+        if name == "max" and len(args) >= 2:
+            return pl.max_horizontal(args)
+        if name == "pow" and len(args) == 2:
+            return self._visit_power(args[0], args[1])
+        raise UnsupportedFormulaError(f"Unsupported function call: {name}")
+
+
+@lru_cache(maxsize=256)
+def _compile_formula_cached(
+    formula: str,
+    param_columns: Tuple[Tuple[str, str], ...],
+    param_consts: Tuple[Tuple[str, Any], ...]
+) -> Optional[pl.Expr]:
+    try:
+        tree = ast.parse(formula, mode="eval")
+        translator = _FormulaTranslator(
+            dict(param_columns), dict(param_consts))
+        # A None result is reported as 0.0, like the eval() path
+        expr = translator.visit(tree).cast(pl.Float64).fill_null(0.0)
+    except (SyntaxError, UnsupportedFormulaError):
+        return None
+
+    guards = translator.guards
+    if not guards:
+        return expr
+
+    return (
+        pl.when(pl.any_horizontal(guards))
+        .then(pl.lit(0.0))
+        .otherwise(expr)
+    )
+
+
+def compile_formula(
+    formula: str,
+    param_column_map: Dict[str, str],
+    param_const_map: Dict[str, Any]
+) -> Optional[pl.Expr]:
+    """
+    Compile a formula string into a native Polars expression.
+
+    Returns None when the formula uses constructs that have no native
+    equivalent, in which case callers should fall back to row-wise
+    evaluation. Results are cached per formula and parameter mapping, so
+    builders created for each report do not re-translate formulas.
+    """
+    param_columns = tuple(sorted(param_column_map.items()))
+    param_consts = tuple(sorted(param_const_map.items()))
+    try:
+        return _compile_formula_cached(formula, param_columns, param_consts)
+    except TypeError:
+        # Unhashable constant values cannot be cached
+        return _compile_formula_cached.__wrapped__(
+            formula, param_columns, param_consts)
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import Optional, Union
+
+import polars as pl
+
+
+def convert_csv_to_parquet(
+    csv_path: Union[str, Path],
+    parquet_path: Optional[Union[str, Path]] = None,
+    row_group_size: int = 100_000
+) -> Path:
+    """
+    Convert a CSV input file to Parquet with row-group statistics.
+
+    The conversion is streamed, so the CSV is never fully loaded. Reports
+    built from the Parquet file skip CSV parsing, and date range filters
+    can skip whole row groups using their min/max statistics.
+
+    Args:
+        csv_path: Path of the CSV file to convert
+        parquet_path: Output path (default: csv_path with .parquet suffix)
+        row_group_size: Number of rows per Parquet row group
+
+    Returns:
+        Path: Path of the written Parquet file
+    """
+    csv_path = Path(csv_path)
+    if parquet_path is None:
+        parquet_path = csv_path.with_suffix(".parquet")
+    parquet_path = Path(parquet_path)
+
+    pl.scan_csv(csv_path).sink_parquet(
+        parquet_path,
+        row_group_size=row_group_size,
+        statistics=True
+    )
+    return parquet_path
+
+
+def scan_report_data(file_path: Union[str, Path]) -> pl.LazyFrame:
+    """Lazily scan a CSV or Parquet input file for report generation."""
+    file_path = Path(file_path)
+
+    if file_path.suffix.lower() == ".parquet":
+        return pl.scan_parquet(file_path)
+    elif file_path.suffix.lower() == ".csv":
+        return pl.scan_csv(file_path)
+    else:
+        raise ValueError(
+            f"Unsupported file format: {file_path.suffix}. "
+            "Only .csv and .parquet are supported."
+        )
@@ -43,6 +43,9 @@ setup(
             "sphinx>=4.0",
             "sphinx-rtd-theme>=1.0",
         ],
+        "json": [
+            "orjson>=3.0",
+        ],
     },
     include_package_data=True,
     package_data={
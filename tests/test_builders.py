@@ -0,0 +1,58 @@
+import unittest
+from datetime import date
+
+import polars as pl
+
+from report_manager.builders.daywise import DaywiseReportBuilder
+from report_manager.exceptions.report_exceptions import (
+    ReportConfigurationError
+)
+
+
+class DateRangeTest(unittest.TestCase):
+    """BaseReportBuilder.set_date_range validation."""
+
+    def test_reversed_date_range_is_rejected(self):
+        with self.assertRaises(ReportConfigurationError):
+            DaywiseReportBuilder().set_date_range(
+                date(2024, 1, 10), date(2024, 1, 9))
+
+    def test_single_day_range_is_accepted(self):
+        builder = DaywiseReportBuilder().set_date_range(
+            date(2024, 1, 9), date(2024, 1, 9))
+        self.assertEqual(builder.start_date, date(2024, 1, 9))
+        self.assertEqual(builder.end_date, date(2024, 1, 9))
+
+
+
+class RowWiseFormulaTest(unittest.TestCase):
+    """Formulas evaluated row by row when they cannot be vectorized."""
+
+    def _calculate(self, mapping, constants):
+        builder = DaywiseReportBuilder()
+        builder.set_constants_map(constants)
+        builder.set_formula_mappings([mapping])
+        df = pl.DataFrame({"qty": [1.0, 5.0]})
+        return builder._add_calculated_columns(df)["ratio"].to_list()
+
+    def test_constants_shadowing_every_parameter(self):
+        # The list argument keeps the formula on the row-wise path
+        mapping = {
+            "column_name": "ratio",
+            "formula": "max([qty, 2.0])",
+            "paramColumnMap": {"qty": "qty"},
+            "paramConstMap": {"qty": "k"},
+        }
+        self.assertEqual(self._calculate(mapping, {"k": 3.0}), [3.0, 3.0])
+
+    def test_unshadowed_parameters_use_row_values(self):
+        mapping = {
+            "column_name": "ratio",
+            "formula": "max([qty, 2.0])",
+            "paramColumnMap": {"qty": "qty"},
+        }
+        self.assertEqual(self._calculate(mapping, {}), [2.0, 5.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
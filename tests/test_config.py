@@ -0,0 +1,59 @@
+import unittest
+
+from report_manager import ConfigLoader
+from report_manager.utils.defaults import DEFAULT_REPORT_CONFIGS
+
+
+class MergeConfigsTest(unittest.TestCase):
+    """ConfigLoader.merge_configs never shares state with its base."""
+
+    def setUp(self):
+        config = dict(DEFAULT_REPORT_CONFIGS["textile"])
+        config["shift_mappings"] = {"A": "Shift A"}
+        self.base = ConfigLoader.from_dict(config)
+
+    def test_merged_config_edits_leave_base_unchanged(self):
+        merged = ConfigLoader.merge_configs(
+            self.base, {"constants": {"k": 2.0}})
+        merged.shift_mappings["B"] = "Shift B"
+        merged.departments["ringframe"].default_grouping_columns.append(
+            "shift_id")
+        del merged.departments["carding"]
+
+        self.assertEqual(self.base.shift_mappings, {"A": "Shift A"})
+        self.assertIn("carding", self.base.departments)
+        self.assertNotIn(
+            "shift_id",
+            self.base.departments["ringframe"].default_grouping_columns)
+        self.assertEqual(merged.constants, {"k": 2.0})
+        self.assertEqual(self.base.constants, {})
+
+
+
+class MixedSourcesTest(unittest.TestCase):
+    """ConfigLoader.from_mixed_sources never shares state with its inputs."""
+
+    def test_loaded_config_edits_leave_sources_unchanged(self):
+        base = {
+            "constants": {"targets": [1, 2]},
+            "extra_settings": {"owner": "ops"},
+        }
+        override = {"constants": {"limits": {"max": 5}}}
+
+        for strategy in ("deep", "shallow"):
+            config = ConfigLoader.from_mixed_sources(
+                base, override, merge_strategy=strategy)
+            config.constants["limits"]["max"] = 10
+            if strategy == "deep":
+                config.constants["targets"].append(3)
+            config.extra_settings["owner"] = "qa"
+
+        self.assertEqual(base, {
+            "constants": {"targets": [1, 2]},
+            "extra_settings": {"owner": "ops"},
+        })
+        self.assertEqual(override, {"constants": {"limits": {"max": 5}}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from datetime import date
+from typing import get_args
+
+from pydantic import ValidationError
+
+from report_manager import ReportCategory, ReportFilter, ReportType
+from report_manager.core.filter import ReportCategoryValue, ReportTypeValue
+
+
+class ReportFilterTest(unittest.TestCase):
+    """Validation rules of ReportFilter."""
+
+    def test_literal_values_match_enums(self):
+        self.assertEqual(
+            get_args(ReportTypeValue),
+            tuple(report_type.value for report_type in ReportType))
+        self.assertEqual(
+            get_args(ReportCategoryValue),
+            tuple(category.value for category in ReportCategory))
+
+    def test_enum_members_are_stored_as_values(self):
+        filter_params = ReportFilter(
+            report_type=ReportType.DAYWISE,
+            category=ReportCategory.LOTWISE,
+        )
+        self.assertEqual(filter_params.report_type, "daywise")
+        self.assertIs(type(filter_params.report_type), str)
+        self.assertEqual(filter_params.category, "lotwise")
+
+    def test_is_instantaneous_is_derived(self):
+        self.assertTrue(ReportFilter(
+            report_type="instantaneous", category="machinewise",
+        ).is_instantaneous)
+        self.assertFalse(ReportFilter(
+            report_type="daywise", category="machinewise",
+        ).is_instantaneous)
+
+    def test_matching_is_instantaneous_input_is_accepted(self):
+        filter_params = ReportFilter(
+            report_type="instantaneous", category="machinewise")
+        self.assertEqual(
+            ReportFilter.model_validate(filter_params.model_dump()),
+            filter_params)
+        self.assertEqual(
+            ReportFilter.from_json(filter_params.model_dump_json()),
+            filter_params)
+
+    def test_conflicting_is_instantaneous_input_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            ReportFilter(
+                report_type="daywise", category="machinewise",
+                is_instantaneous=True)
+        with self.assertRaises(ValidationError):
+            ReportFilter.from_json(
+                '{"report_type": "instantaneous", "category": "lotwise", '
+                '"is_instantaneous": false}')
+
+    def test_reversed_date_range_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            ReportFilter(
+                report_type="daywise", category="machinewise",
+                start_date=date(2024, 1, 10), end_date=date(2024, 1, 9))
+
+    def test_single_day_and_open_ranges_are_accepted(self):
+        for start_date, end_date in [
+                (date(2024, 1, 9), date(2024, 1, 9)),
+                (date(2024, 1, 9), None),
+                (None, date(2024, 1, 9))]:
+            filter_params = ReportFilter(
+                report_type="daywise", category="machinewise",
+                start_date=start_date, end_date=end_date)
+            self.assertEqual(filter_params.start_date, start_date)
+            self.assertEqual(filter_params.end_date, end_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
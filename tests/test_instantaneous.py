@@ -0,0 +1,61 @@
+import unittest
+
+import polars as pl
+
+from report_manager import ConfigLoader, ReportFilter, ReportManager
+from report_manager.utils.defaults import DEFAULT_REPORT_CONFIGS
+
+
+class InstantaneousReportTest(unittest.TestCase):
+    """Regression tests for the instantaneous report builder."""
+
+    def setUp(self):
+        config = dict(DEFAULT_REPORT_CONFIGS["textile"])
+        config["column_definitions"] = dict(
+            config["column_definitions"],
+            production_qty={
+                "name": "Production",
+                "unit": "Kg",
+                "grouping_type": "aggregation",
+            },
+        )
+        self.manager = ReportManager(ConfigLoader.from_dict(config))
+        # Two shifts running the same machines on the same day, with two
+        # readings per machine and shift
+        self.df = pl.DataFrame({
+            "date": ["2024-01-01"] * 8,
+            "shift_id": [1, 1, 1, 1, 2, 2, 2, 2],
+            "platform_shift_id": ["A", "A", "A", "A", "B", "B", "B", "B"],
+            "lot_number": ["L1"] * 8,
+            "asset_id": ["M1", "M1", "M2", "M2", "M1", "M1", "M2", "M2"],
+            "machine_name": [
+                "Mc1", "Mc1", "Mc2", "Mc2", "Mc1", "Mc1", "Mc2", "Mc2"],
+            "count_ne": ["20/1"] * 8,
+            "production_qty": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+        })
+
+    def _records(self):
+        filter_params = ReportFilter(
+            department_id="ringframe",
+            report_type="instantaneous",
+            category="machinewise",
+        )
+        report = self.manager.generate_report(self.df, filter_params)
+        return report["sections"]["subsections"]["records"]
+
+    def test_records_cover_every_shift(self):
+        records = self._records()
+        expected = self.df.select(
+            ["platform_shift_id", "asset_id"]).unique().height
+        self.assertEqual(len(records), expected)
+
+    def test_records_keep_all_production(self):
+        records = self._records()
+        self.assertEqual(
+            sorted(record["production_qty"] for record in records),
+            [3.0, 7.0, 11.0, 15.0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()